@@ -2,24 +2,54 @@ import pygame
 import os
 import uuid
 import base64
+import copy
+import binascii
+import functools
 import hashlib
 import json
 import socket
 import threading
+import concurrent.futures
+import queue
 import time
 import struct
+import zlib
+from collections import deque
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # =========================
 # HELPER FUNCTIONS
 # =========================
 
+# 4-byte big-endian length prefix, compiled once
+_LEN = struct.Struct('!I')
+
+def encode_msg(msg_dict):
+    """Encode a message as a JSON payload (without its length prefix)"""
+    if orjson:
+        return orjson.dumps(msg_dict)
+    return json.dumps(msg_dict).encode('utf-8')
+
 def send_msg(sock, msg_dict):
     """Send a length-prefixed JSON message"""
-    msg_json = json.dumps(msg_dict)
-    msg_bytes = msg_json.encode('utf-8')
-    msg_len = len(msg_bytes)
+    msg_bytes = encode_msg(msg_dict)
+    header = _LEN.pack(len(msg_bytes))
     # Send 4-byte length prefix, then the message
-    sock.sendall(struct.pack('!I', msg_len) + msg_bytes)
+    if hasattr(sock, 'sendmsg'):
+        # Scatter-gather: header and payload go out in one syscall without
+        # building a concatenated copy of the frame
+        sent = sock.sendmsg([header, msg_bytes])
+        if sent < len(header):
+            sock.sendall(header[sent:])
+            sock.sendall(msg_bytes)
+        elif sent < len(header) + len(msg_bytes):
+            sock.sendall(memoryview(msg_bytes)[sent - len(header):])
+    else:
+        sock.sendall(header + msg_bytes)
 
 def recv_msg(sock):
     """Receive a length-prefixed JSON message"""
@@ -27,21 +57,31 @@ def recv_msg(sock):
     raw_msglen = recv_all(sock, 4)
     if not raw_msglen:
         return None
-    msglen = struct.unpack('!I', raw_msglen)[0]
+    msglen = _LEN.unpack(raw_msglen)[0]
     # Read the message data
     msg_bytes = recv_all(sock, msglen)
     if not msg_bytes:
         return None
+    return decode_msg(msg_bytes)
+
+def decode_msg(msg_bytes):
+    """Decode a JSON message payload (without its length prefix)"""
+    if orjson:
+        return orjson.loads(msg_bytes)
     return json.loads(msg_bytes.decode('utf-8'))
 
 def recv_all(sock, n):
     """Helper to receive exactly n bytes"""
-    data = bytearray()
-    while len(data) < n:
-        packet = sock.recv(n - len(data))
-        if not packet:
+    data = bytearray(n)
+    view = memoryview(data)
+    received = 0
+    # No MSG_WAITALL: Windows rejects it on sockets with a timeout (the probe's),
+    # so read into the buffer until it is full
+    while received < n:
+        count = sock.recv_into(view[received:], n - received)
+        if not count:
             return None
-        data.extend(packet)
+        received += count
     return bytes(data)
 
 # =========================
@@ -81,10 +121,12 @@ def load_texture_pack(pack_name):
             block_textures[block_type] = None
     
     current_texture_pack = pack_name
+    block_surface.cache_clear()
+    block_icon.cache_clear()
     
     # Save to settings
     settings["texture_pack"] = pack_name
-    save_settings(settings)
+    save_later(save_settings, settings)
 
 def get_available_texture_packs():
     """Get list of available texture packs"""
@@ -101,18 +143,35 @@ def get_available_texture_packs():
     
     return packs
 
-def draw_block(surface, block_type, x, y):
-    """Draw a block with texture or fallback to color"""
+@functools.lru_cache(maxsize=None)
+def block_surface(bid):
+    """One tile for a block ID: its pack texture, or its color with a black outline"""
+    block_type = BLOCK_NAMES[bid]
     texture = block_textures.get(block_type)
-    
     if texture:
-        # Draw texture
-        surface.blit(texture, (x, y))
-    else:
-        # Fallback to color
-        color = BLOCK_COLORS.get(block_type, GRAY)
-        pygame.draw.rect(surface, color, (x, y, BLOCK_SIZE, BLOCK_SIZE))
-        pygame.draw.rect(surface, BLACK, (x, y, BLOCK_SIZE, BLOCK_SIZE), 1)
+        return texture.convert_alpha()
+    surf = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE)).convert()
+    surf.fill(BLOCK_COLORS.get(block_type, GRAY))
+    pygame.draw.rect(surf, BLACK, (0, 0, BLOCK_SIZE, BLOCK_SIZE), 1)
+    return surf
+
+def render_chunk(world, cx, cy):
+    """Rasterize one chunk of the world (sky included) into its own surface"""
+    x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+    rows = world[y0:y0 + CHUNK_SIZE]
+    width = min(CHUNK_SIZE, len(world[0]) - x0)
+    surf = pygame.Surface((width * BLOCK_SIZE, len(rows) * BLOCK_SIZE)).convert()
+    surf.fill(SKY_BLUE)
+    # Tile lookup by block ID, so the inner loop is a list index rather than a cache call.
+    # The network thread may register a new ID after this list is built, so those fall back
+    tiles = [block_surface(bid) for bid in range(len(BLOCK_NAMES))]
+    surf.blits([
+        (tiles[block] if block < len(tiles) else block_surface(block), (x * BLOCK_SIZE, y * BLOCK_SIZE))
+        for y, row in enumerate(rows)
+        for x, block in enumerate(row[x0:x0 + width])
+        if block != AIR
+    ], doreturn=False)
+    return surf
 
 # =========================
 # CONFIG
@@ -126,6 +185,8 @@ SERVERS_FILE = "servers.json"
 SETTINGS_FILE = "settings.json"
 
 BLOCK_SIZE = 32
+CHUNK_SIZE = 16  # World is rendered and cached in CHUNK_SIZE x CHUNK_SIZE block tiles
+PLAYER_CELL = 4  # Other players are bucketed in PLAYER_CELL x PLAYER_CELL block cells
 PLAYER_WIDTH = 28
 PLAYER_HEIGHT = 64  # 2 blocks high
 
@@ -158,6 +219,120 @@ BLOCK_COLORS = {
     "leaves": (34, 139, 34),  # Forest green leaves
 }
 
+# The world is stored as rows of one-byte block IDs instead of name strings.
+# BLOCK_NAMES maps an ID back to its name for textures and colors.
+BLOCK_NAMES = list(BLOCK_COLORS)
+BLOCK_IDS = {name: i for i, name in enumerate(BLOCK_NAMES)}
+AIR = BLOCK_IDS["air"]
+LADDER = BLOCK_IDS["ladder"]
+
+# Collision lookup indexed by block ID: everything but air and ladders is solid,
+# including IDs block_id() registers later for names we don't know
+IS_SOLID = bytearray([1]) * 256
+IS_SOLID[AIR] = 0
+IS_SOLID[LADDER] = 0
+
+# World rows are bytearrays, so 255 is the last ID; it is shared by every name past the limit
+MAX_BLOCK_ID = 255
+
+def block_id(name):
+    """Return the ID for a block name, registering names the server adds"""
+    bid = BLOCK_IDS.get(name)
+    if bid is None:
+        if len(BLOCK_NAMES) < MAX_BLOCK_ID:
+            bid = len(BLOCK_NAMES)
+            BLOCK_NAMES.append(name)
+        else:
+            # Out of byte values: draw the rest as one solid "unknown" block
+            if len(BLOCK_NAMES) == MAX_BLOCK_ID:
+                BLOCK_NAMES.append("unknown")
+            bid = MAX_BLOCK_ID
+        BLOCK_IDS[name] = bid
+    return bid
+
+def unpack_world(height, width, blob, palette=None):
+    """Decode a base64 zlib blob of height*width block bytes into bytearray rows
+
+    Byte values index into palette (the server's block names, defaulting to ours)
+    and are remapped to local IDs with a single translate() over the whole blob.
+    """
+    raw = zlib.decompress(base64.b64decode(blob))
+    if len(raw) != height * width:
+        raise ValueError(f"world blob is {len(raw)} bytes, expected {height}x{width}")
+    if palette is not None and len(palette) > 256:
+        raise ValueError(f"world palette has {len(palette)} names, at most 256 fit in a byte")
+    known = len(palette) if palette is not None else len(BLOCK_NAMES)
+    # Bytes with no block behind them become "unknown", so the renderer can look up every ID
+    stray = known < 256 and bool(raw) and max(raw) >= known
+    if palette is not None or stray:
+        table = bytearray(range(256))
+        if palette is not None:
+            for i, name in enumerate(palette):
+                table[i] = block_id(name)
+        if stray:
+            table[known:] = bytes([block_id("unknown")]) * (256 - known)
+        raw = raw.translate(table)
+    return [bytearray(raw[y * width:(y + 1) * width]) for y in range(height)]
+
+def resolve_collisions(world, px, py, vx, vy, dt):
+    """Move the player one step through the world, returns (x, y, vy, on_ground)"""
+    world_h = len(world)
+    world_w = len(world[0])
+
+    # Horizontal: only take the step if the new position overlaps no solid block.
+    # A step is under one block wide, so the only cells it can newly enter are in
+    # the column under the leading edge
+    if vx != 0:
+        new_x = px + vx * dt
+        left, right = new_x - 0.4, new_x + 0.4
+        check_x = int(right if vx > 0 else left)
+        grid_y = int(py)
+        top, bottom = py + 0.1, py + 1.9
+        blocked = False
+        if 0 <= check_x < world_w and right > check_x and left < check_x + 1:
+            for check_y in (grid_y, grid_y + 1):
+                if (0 <= check_y < world_h and IS_SOLID[world[check_y][check_x]]
+                        and bottom > check_y and top < check_y + 1):
+                    blocked = True
+                    break
+        if not blocked:
+            px = new_x
+
+    # Apply vertical velocity, clamped to world bounds
+    py += vy * dt
+    px = max(0.5, min(px, world_w - 1.5))
+    py = max(0, min(py, world_h - 2.5))
+
+    # Vertical: snap onto floors and under ceilings we only just crossed
+    grid_x = int(px)
+    grid_y = int(py)
+    left, right = px - 0.4, px + 0.4
+    # Only columns with significant horizontal overlap can stop us; that doesn't
+    # depend on the row, so pick them once instead of testing all nine cells
+    columns = [
+        check_x for check_x in range(max(grid_x - 1, 0), min(grid_x + 2, world_w))
+        if min(right, check_x + 1) - max(left, check_x) > 0.1
+    ]
+    on_ground = False
+    for check_y in range(max(grid_y, 0), min(grid_y + 3, world_h)):
+        row = world[check_y]
+        for check_x in columns:
+            if not IS_SOLID[row[check_x]]:
+                continue
+            if py + 2 > check_y and py < check_y + 1:
+                if vy > 0:  # Falling
+                    if py + 2 - check_y < 0.5:
+                        py = check_y - 2
+                        vy = 0
+                        on_ground = True
+                elif vy < 0:  # Jumping into ceiling
+                    if check_y + 1 - py < 0.5:
+                        py = check_y + 1
+                        vy = 0
+
+    # A ceiling snap near the top edge can push us above the world; x is unchanged since the clamp
+    return px, max(py, 0), vy, on_ground
+
 # Player colors (for body/clothes)
 PLAYER_COLORS = {
     "red": (255, 0, 0),
@@ -175,8 +350,66 @@ pygame.init()
 # Screen will be initialized after loading settings
 screen = None
 clock = pygame.time.Clock()
-font = pygame.font.SysFont("Arial", 18)
-small_font = pygame.font.SysFont("Arial", 14)
+
+# Every (size, bold) Arial font the UI uses, opened once at startup
+FONTS = {
+    (size, bold): pygame.font.SysFont("Arial", size, bold=bold)
+    for size, bold in [(14, False), (18, False), (28, True), (36, True), (48, True)]
+}
+font = FONTS[(18, False)]
+small_font = FONTS[(14, False)]
+
+@functools.lru_cache(maxsize=1024)
+def render_text(text, size, bold, color):
+    """Render a text surface once and reuse it for identical requests"""
+    return FONTS[(size, bold)].render(text, True, color).convert_alpha()
+
+@functools.lru_cache(maxsize=None)
+def player_sprite(body_color):
+    """Rasterize a player (head on top of body, both outlined) once per body color"""
+    surf = pygame.Surface((PLAYER_WIDTH, PLAYER_HEIGHT)).convert()
+    head_rect = pygame.Rect(0, 0, PLAYER_WIDTH, PLAYER_HEIGHT // 2)
+    body_rect = pygame.Rect(0, PLAYER_HEIGHT // 2, PLAYER_WIDTH, PLAYER_HEIGHT // 2)
+    pygame.draw.rect(surf, body_color, body_rect)
+    pygame.draw.rect(surf, BLACK, body_rect, 2)
+    pygame.draw.rect(surf, PINK, head_rect)
+    pygame.draw.rect(surf, BLACK, head_rect, 2)
+    return surf
+
+HOTBAR_SLOTS = 7
+HOTBAR_PITCH = 50  # Slot spacing; slots are 40px boxes with 10px gaps
+HOTBAR_WIDTH = HOTBAR_SLOTS * HOTBAR_PITCH + 20
+
+@functools.lru_cache(maxsize=HOTBAR_SLOTS)
+def hotbar_strip(selected_slot):
+    """The hotbar background with every slot outline and the selection highlight"""
+    surf = pygame.Surface((HOTBAR_WIDTH, 60), pygame.SRCALPHA).convert_alpha()
+    surf.fill((50, 50, 50, 200))
+    for i in range(HOTBAR_SLOTS):
+        slot_x = 10 + i * HOTBAR_PITCH
+        if i == selected_slot:
+            pygame.draw.rect(surf, (255, 255, 100), (slot_x - 2, 8, 44, 44), 3)
+        else:
+            pygame.draw.rect(surf, WHITE, (slot_x, 10, 40, 40), 2)
+    return surf
+
+@functools.lru_cache(maxsize=None)
+def block_icon(block_type, size):
+    """A block's texture (or fallback color) scaled to size x size, for item slots"""
+    texture = block_textures.get(block_type)
+    if texture:
+        return pygame.transform.scale(texture, (size, size)).convert_alpha()
+    surf = pygame.Surface((size, size)).convert()
+    surf.fill(BLOCK_COLORS.get(block_type, GRAY))
+    return surf
+
+@functools.lru_cache(maxsize=64)
+def translucent(size, color, alpha):
+    """A solid color panel drawn at a fixed opacity, built once per size/color/alpha"""
+    surf = pygame.Surface(size).convert()
+    surf.fill(color)
+    surf.set_alpha(alpha)
+    return surf
 
 # =========================
 # DEFAULT CONTROLS
@@ -253,6 +486,7 @@ TRANSLATIONS = {
         # Server List
         "add_server": "Add Server",
         "refresh": "Refresh",
+        "refreshing": "Refreshing...",
         "join": "Join",
         "modify": "Modify",
         "delete": "Delete",
@@ -337,6 +571,7 @@ TRANSLATIONS = {
         # Server List
         "add_server": "Aggiungi Server",
         "refresh": "Aggiorna",
+        "refreshing": "Aggiornamento...",
         "join": "Entra",
         "modify": "Modifica",
         "delete": "Elimina",
@@ -431,6 +666,7 @@ TRANSLATIONS = {
         # Server List
         "add_server": "Adicionar Servidor",
         "refresh": "Atualizar",
+        "refreshing": "Atualizando...",
         "join": "Entrar",
         "modify": "Modificar",
         "delete": "Excluir",
@@ -525,6 +761,7 @@ TRANSLATIONS = {
         # Server List
         "add_server": "Server Hinzufügen",
         "refresh": "Aktualisieren",
+        "refreshing": "Aktualisiere...",
         "join": "Beitreten",
         "modify": "Bearbeiten",
         "delete": "Löschen",
@@ -619,6 +856,7 @@ TRANSLATIONS = {
         # Server List
         "add_server": "Añadir Servidor",
         "refresh": "Actualizar",
+        "refreshing": "Actualizando...",
         "join": "Unirse",
         "modify": "Modificar",
         "delete": "Eliminar",
@@ -672,14 +910,28 @@ TRANSLATIONS = {
     }
 }
 
+# Active language and its translation table, both swapped by set_language()
+CURRENT_LANG = "english"
+_lang_table = TRANSLATIONS["english"]
+
+def set_language(lang):
+    """Make t() translate into the given language"""
+    global CURRENT_LANG, _lang_table
+    CURRENT_LANG = lang
+    _lang_table = TRANSLATIONS.get(lang, TRANSLATIONS["english"])
+
 def t(key):
     """Get translation for current language"""
-    lang = settings.get("language", DEFAULT_LANGUAGE)
-    return TRANSLATIONS.get(lang, TRANSLATIONS["english"]).get(key, key)
+    return _lang_table.get(key, key)
 
 # =========================
 # SETTINGS
 # =========================
+def read_json(path):
+    """Parse a JSON file, using the faster orjson decoder when available"""
+    with open(path, "rb") as f:
+        return decode_msg(f.read())
+
 def load_settings():
     if not os.path.exists(SETTINGS_FILE):
         settings = {
@@ -691,26 +943,79 @@ def load_settings():
         }
         with open(SETTINGS_FILE, "w") as f:
             json.dump(settings, f, indent=4)
-    with open(SETTINGS_FILE) as f:
-        loaded = json.load(f)
-        # Ensure all settings exist
-        if "appearance" not in loaded:
-            loaded["appearance"] = DEFAULT_APPEARANCE.copy()
-        if "language" not in loaded:
-            loaded["language"] = DEFAULT_LANGUAGE
-        if "video" not in loaded:
-            loaded["video"] = DEFAULT_VIDEO.copy()
-        if "texture_pack" not in loaded:
-            loaded["texture_pack"] = "default"
-        return loaded
+    loaded = read_json(SETTINGS_FILE)
+    # Ensure all settings exist
+    if "appearance" not in loaded:
+        loaded["appearance"] = DEFAULT_APPEARANCE.copy()
+    if "language" not in loaded:
+        loaded["language"] = DEFAULT_LANGUAGE
+    if "video" not in loaded:
+        loaded["video"] = DEFAULT_VIDEO.copy()
+    if "texture_pack" not in loaded:
+        loaded["texture_pack"] = "default"
+    return loaded
 
 def save_settings(settings):
     with open(SETTINGS_FILE, "w") as f:
         json.dump(settings, f, indent=4)
 
+# Write-behind saves: save_fn -> (armed Timer, snapshot it will write)
+_pending_saves = {}
+_pending_lock = threading.Lock()
+_save_io_lock = threading.Lock()  # One writer at a time, in the order they fire
+
+def save_later(save_fn, data, delay=0.5):
+    """Save a snapshot of data off the UI thread once edits stop for delay seconds"""
+    # Snapshot now so the timer thread never serializes a list the UI is editing
+    timer = threading.Timer(delay, _run_save, (save_fn, copy.deepcopy(data)))
+    timer.daemon = True
+    with _pending_lock:
+        previous = _pending_saves.get(save_fn)
+        if previous:
+            previous[0].cancel()
+        _pending_saves[save_fn] = (timer, timer.args[1])
+        timer.start()
+
+def _run_save(save_fn, data):
+    with _pending_lock:
+        entry = _pending_saves.get(save_fn)
+        # Superseded by a newer snapshot, or already written by flush_saves()
+        if not entry or entry[0] is not threading.current_thread():
+            return
+        del _pending_saves[save_fn]
+        # Taken before _pending_lock is released, so flush_saves() can't slip in between
+        _save_io_lock.acquire()
+    try:
+        save_fn(data)
+    finally:
+        _save_io_lock.release()
+
+def flush_saves():
+    """Write any pending saves right away (before leaving a screen or exiting)"""
+    with _pending_lock:
+        pending = list(_pending_saves.items())
+        _pending_saves.clear()
+    for save_fn, (timer, data) in pending:
+        timer.cancel()
+        with _save_io_lock:
+            save_fn(data)
+    # Wait out a timer that was already mid-write, so exiting can't cut a file off
+    with _save_io_lock:
+        pass
+
 settings = load_settings()
+set_language(settings.get("language", DEFAULT_LANGUAGE))
 controls = settings.get("controls", DEFAULT_CONTROLS.copy())
 appearance = settings.get("appearance", DEFAULT_APPEARANCE.copy())
+# Cached so render paths don't look it up in appearance every frame
+CURRENT_COLOR = appearance.get("player_color", "blue")
+
+def set_player_color(color):
+    """Update the player color in settings and in the cached CURRENT_COLOR"""
+    global CURRENT_COLOR
+    CURRENT_COLOR = color
+    appearance["player_color"] = color
+    settings["appearance"] = appearance
 
 # Apply saved video settings
 saved_video = settings.get("video", DEFAULT_VIDEO)
@@ -740,8 +1045,11 @@ except:
 # =========================
 # PLAYER ID SAFE
 # =========================
+# Key bytes are fixed, so encode them once instead of on every sign()
+_SECRET_BYTES = SECRET_KEY.encode()
+
 def sign(player_id):
-    return hashlib.sha256((player_id + SECRET_KEY).encode()).hexdigest()
+    return hashlib.sha256(player_id.encode() + _SECRET_BYTES).hexdigest()
 
 def save_player_id(player_id):
     signature = sign(player_id)
@@ -756,13 +1064,14 @@ def load_player_id():
         save_player_id(pid)
         return pid
     try:
-        encoded = open(PLAYER_FILE).read()
-        raw = base64.b64decode(encoded).decode()
-        player_id, signature = raw.split("|")
+        with open(PLAYER_FILE, "rb") as f:
+            encoded = f.read()
+        raw = base64.b64decode(encoded)
+        player_id, signature = raw.decode("ascii").split("|", 1)
         if sign(player_id) != signature:
             raise ValueError("Invalid signature")
         return player_id
-    except:
+    except (OSError, ValueError, binascii.Error):
         pid = str(uuid.uuid4())[:6]
         save_player_id(pid)
         return pid
@@ -776,8 +1085,7 @@ def load_servers():
     if not os.path.exists(SERVERS_FILE):
         with open(SERVERS_FILE, "w") as f:
             json.dump([], f)
-    with open(SERVERS_FILE) as f:
-        return json.load(f)
+    return read_json(SERVERS_FILE)
 
 def save_servers(servers):
     with open(SERVERS_FILE, "w") as f:
@@ -799,33 +1107,62 @@ class ServerConnection:
         self.server_name = ""
         self.motd = ""
         self.world = []
+        self.dirty_chunks = set()  # (cx, cy) of chunks changed by update_block since last render
         self.players = {}  # other_pid -> (x, y)
         self.player_colors = {}  # other_pid -> color
+        self.player_grid = {}  # (cell_x, cell_y) -> set of other_pids in that cell
+        self._player_cell = {}  # other_pid -> its key in player_grid
         self.player_x = 10
         self.player_y = 3
         self.hotbar = [None] * 7
         self.inventory = [None] * 21
         self.crafting_grid = [None] * 9  # 3x3 crafting grid
-        self.chat_messages = []
+        self.chat_messages = deque(maxlen=100)  # Oldest lines drop off automatically
         self.max_chat_display = 5
-        self.last_position_send = time.time()
+        self._pending_pos = None  # Latest position not yet sent, latest wins
+        self._pos_lock = threading.Lock()
+        self._outq = []  # Framed packets waiting for the writer thread
+        self._out_lock = threading.Lock()
+        self._out_ready = threading.Event()
+        # Packet type -> handler; one dict lookup instead of an if/elif chain
+        self._handlers = {
+            "welcome": self._on_welcome,
+            "welcome_v2": self._on_welcome,
+            "respawn": self._on_respawn,
+            "chat": self._on_chat,
+            "update_block": self._on_update_block,
+            "player_join": self._on_player_join,
+            "player_move": self._on_player_move,
+            "player_color": self._on_player_color,
+            "player_leave": self._on_player_leave,
+            "hotbar_update": self._on_hotbar_update,
+            "inventory_update": self._on_inventory_update,
+            "disconnect": self._on_disconnect,
+        }
         self.disconnect_reason = None
         self.respawn_flag = False
         self.max_players = 10
         self.current_players = 0
+        self._rxbuf = bytearray()  # Received bytes not yet consumed
+        self._rxview = 0  # Read offset into _rxbuf
+        self._inq = queue.SimpleQueue()  # Received frames waiting for the dispatcher thread
+        self.ready_event = threading.Event()  # Set on welcome or as soon as the connection drops
 
     def connect(self):
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(5)
             self.sock.connect((self.ip, self.port))
+            # Packets are tiny and latency-sensitive: don't let Nagle hold them back
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 17)
             
             # Send login packet with password and color
             send_msg(self.sock, {
                 "type": "login",
                 "id": PLAYER_ID,
                 "password": self.password,
-                "color": appearance.get("player_color", "blue")
+                "color": CURRENT_COLOR
             })
             
             # Remove timeout for ongoing communication
@@ -833,156 +1170,262 @@ class ServerConnection:
             
             self.connected = True
             threading.Thread(target=self.listen_server, daemon=True).start()
+            threading.Thread(target=self._dispatcher, daemon=True).start()
+            threading.Thread(target=self._pos_flusher, daemon=True).start()
+            threading.Thread(target=self._writer, daemon=True).start()
             return True
         except Exception as e:
             print(f"Connection error: {e}")
             self.connected = False
             return False
 
+    def _recv_into(self, min_bytes):
+        """Buffer at least min_bytes of unread data, taking as much as the kernel has"""
+        while len(self._rxbuf) - self._rxview < min_bytes:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                return False
+            self._rxbuf.extend(chunk)
+        return True
+
+    def recv_frame_stream(self):
+        """Receive the next length-prefixed payload from the buffered stream, undecoded"""
+        if not self._recv_into(4):
+            return None
+        msglen = _LEN.unpack_from(self._rxbuf, self._rxview)[0]
+        if not self._recv_into(4 + msglen):
+            return None
+        start = self._rxview + 4
+        msg_bytes = self._rxbuf[start:start + msglen]
+        self._rxview = start + msglen
+        
+        # Compact the buffer once everything is consumed or the dead prefix grows large
+        if self._rxview == len(self._rxbuf):
+            self._rxbuf.clear()
+            self._rxview = 0
+        elif self._rxview > 65536:
+            del self._rxbuf[:self._rxview]
+            self._rxview = 0
+        
+        return msg_bytes
+
     def listen_server(self):
+        """Read frames off the socket and hand them to the dispatcher thread"""
         while self.connected:
             try:
-                msg = recv_msg(self.sock)
-                if not msg:
+                frame = self.recv_frame_stream()
+                if frame is None:
                     print("Connection closed by server")
                     self.connected = False
                     break
-                
-                # Process the message
-                if msg.get("type") == "welcome":
-                    self.server_name = msg.get("server", "")
-                    self.motd = msg.get("motd", "")
-                    self.world = msg.get("world", [])
-                    self.player_x = msg.get("x", 10)
-                    self.player_y = msg.get("y", 3)
-                    self.hotbar = msg.get("hotbar", [None] * 7)
-                    self.inventory = msg.get("inventory", [None] * 21)  # Receive inventory!
-                    self.player_level = msg.get("level", 0)
-                    self.max_players = msg.get("max_players", 10)
-                    self.current_players = msg.get("current_players", 1)
-                    print(f"Received welcome: world size {len(self.world)}x{len(self.world[0]) if self.world else 0}")
-                
-                elif msg.get("type") == "respawn":
-                    self.player_x = msg.get("x", 10)
-                    self.player_y = msg.get("y", 3)
-                    self.respawn_flag = True
-                    print(f"Respawned at ({self.player_x}, {self.player_y})")
-                    
-                elif msg.get("type") == "chat":
-                    pid = msg.get("from", "???")
-                    level = msg.get("level", 0)
-                    text = msg.get("message", "")
-                    chat_line = f"{pid} [{level}] >> {text}"
-                    self.chat_messages.append(chat_line)
-                    if len(self.chat_messages) > 100:
-                        self.chat_messages.pop(0)
-                
-                elif msg.get("type") == "update_block":
-                    x, y = msg.get("x"), msg.get("y")
-                    block = msg.get("block")
-                    if 0 <= y < len(self.world) and 0 <= x < len(self.world[0]):
-                        self.world[y][x] = block
-                
-                elif msg.get("type") == "player_join":
-                    pid = msg.get("id")
-                    x, y = msg.get("x"), msg.get("y")
-                    color = msg.get("color", "blue")
-                    self.players[pid] = (x, y)
-                    self.player_colors[pid] = color
-                    print(f"Player {pid} joined at ({x}, {y}) with color {color}")
-                
-                elif msg.get("type") == "player_move":
-                    pid = msg.get("id")
-                    x, y = msg.get("x"), msg.get("y")
-                    self.players[pid] = (x, y)
-                
-                elif msg.get("type") == "player_color":
-                    pid = msg.get("id")
-                    color = msg.get("color", "blue")
-                    self.player_colors[pid] = color
-                    print(f"Player {pid} changed color to {color}")
-                
-                elif msg.get("type") == "player_leave":
-                    pid = msg.get("id")
-                    if pid in self.players:
-                        del self.players[pid]
-                    if pid in self.player_colors:
-                        del self.player_colors[pid]
-                    print(f"Player {pid} left")
-                
-                elif msg.get("type") == "hotbar_update":
-                    self.hotbar = msg.get("hotbar", [None] * 7)
-                
-                elif msg.get("type") == "inventory_update":
-                    self.inventory = msg.get("inventory", [None] * 21)
-                
-                elif msg.get("type") == "disconnect":
-                    reason = msg.get("reason", "Disconnected")
-                    self.disconnect_reason = reason
-                    print(f"Disconnected: {reason}")
-                    self.connected = False
-                    break
-                    
+                self._inq.put(frame)
+            except Exception as e:
+                print(f"Listen error: {e}")
+                self.connected = False
+                break
+        # Let the dispatcher drain what was received, then stop
+        self._inq.put(None)
+
+    def _dispatcher(self):
+        """Decode received frames and apply them, off the socket-reading thread"""
+        while True:
+            frame = self._inq.get()
+            if frame is None:
+                break
+            try:
+                msg = decode_msg(frame)
+                handler = self._handlers.get(msg.get("type"))
+                if handler:
+                    handler(msg)
             except Exception as e:
                 print(f"Listen error: {e}")
                 self.connected = False
                 break
+        # Wake anyone still waiting for the handshake to settle
+        self.ready_event.set()
+
+    def _on_welcome(self, msg):
+        self.server_name = msg.get("server", "")
+        self.motd = msg.get("motd", "")
+        if msg.get("type") == "welcome_v2":
+            # Binary world: "hw" is (height, width), "world" the packed block bytes
+            height, width = msg["hw"]
+            self.world = unpack_world(height, width, msg["world"], msg.get("palette"))
+        else:
+            self.world = [bytearray(block_id(b) for b in row) for row in msg.get("world", [])]
+        self.player_x = msg.get("x", 10)
+        self.player_y = msg.get("y", 3)
+        self.hotbar = msg.get("hotbar", [None] * 7)
+        self.inventory = msg.get("inventory", [None] * 21)  # Receive inventory!
+        self.player_level = msg.get("level", 0)
+        self.max_players = msg.get("max_players", 10)
+        self.current_players = msg.get("current_players", 1)
+        print(f"Received welcome: world size {len(self.world)}x{len(self.world[0]) if self.world else 0}")
+        self.ready_event.set()
+
+    def _on_respawn(self, msg):
+        self.player_x = msg.get("x", 10)
+        self.player_y = msg.get("y", 3)
+        self.respawn_flag = True
+        print(f"Respawned at ({self.player_x}, {self.player_y})")
+
+    def _on_chat(self, msg):
+        pid = msg.get("from", "???")
+        level = msg.get("level", 0)
+        text = msg.get("message", "")
+        chat_line = f"{pid} [{level}] >> {text}"
+        self.chat_messages.append(chat_line)
+
+    def _on_update_block(self, msg):
+        x, y = msg.get("x"), msg.get("y")
+        block = msg.get("block")
+        if 0 <= y < len(self.world) and 0 <= x < len(self.world[0]):
+            self.world[y][x] = block_id(block)
+            self.dirty_chunks.add((x // CHUNK_SIZE, y // CHUNK_SIZE))
+
+    def _on_player_join(self, msg):
+        pid = msg.get("id")
+        x, y = msg.get("x"), msg.get("y")
+        color = msg.get("color", "blue")
+        self.players[pid] = (x, y)
+        self._grid_place(pid, x, y)
+        self.player_colors[pid] = color
+        print(f"Player {pid} joined at ({x}, {y}) with color {color}")
+
+    def _on_player_move(self, msg):
+        pid = msg.get("id")
+        x, y = msg.get("x"), msg.get("y")
+        self.players[pid] = (x, y)
+        self._grid_place(pid, x, y)
+
+    def _on_player_color(self, msg):
+        pid = msg.get("id")
+        color = msg.get("color", "blue")
+        self.player_colors[pid] = color
+        print(f"Player {pid} changed color to {color}")
+
+    def _on_player_leave(self, msg):
+        pid = msg.get("id")
+        if pid in self.players:
+            del self.players[pid]
+        self._grid_remove(pid)
+        if pid in self.player_colors:
+            del self.player_colors[pid]
+        print(f"Player {pid} left")
+
+    def _grid_place(self, pid, x, y):
+        """File a player under the grid cell containing (x, y)"""
+        cell = (int(x) // PLAYER_CELL, int(y) // PLAYER_CELL)
+        if self._player_cell.get(pid) != cell:
+            self._grid_remove(pid)
+            self.player_grid.setdefault(cell, set()).add(pid)
+            self._player_cell[pid] = cell
+
+    def _grid_remove(self, pid):
+        cell = self._player_cell.pop(pid, None)
+        if cell is not None:
+            members = self.player_grid[cell]
+            members.discard(pid)
+            if not members:
+                del self.player_grid[cell]
+
+    def players_near(self, x, y):
+        """Positions of the other players in the 3x3 grid cells around (x, y)"""
+        cx, cy = int(x) // PLAYER_CELL, int(y) // PLAYER_CELL
+        near = []
+        for gy in range(cy - 1, cy + 2):
+            for gx in range(cx - 1, cx + 2):
+                # tuple() copies the set in one step; the dispatcher may be editing it
+                for pid in tuple(self.player_grid.get((gx, gy), ())):
+                    pos = self.players.get(pid)
+                    if pos is not None:
+                        near.append(pos)
+        return near
+
+    def _on_hotbar_update(self, msg):
+        self.hotbar = msg.get("hotbar", [None] * 7)
+
+    def _on_inventory_update(self, msg):
+        self.inventory = msg.get("inventory", [None] * 21)
+
+    def _on_disconnect(self, msg):
+        reason = msg.get("reason", "Disconnected")
+        self.disconnect_reason = reason
+        print(f"Disconnected: {reason}")
+        self.connected = False
 
-    def send_chat(self, message):
-        if self.connected:
-            packet = {"type": "chat", "message": message}
+    def _send(self, packet):
+        """Queue a packet; the writer thread sends everything queued together"""
+        if not self.connected:
+            return
+        payload = encode_msg(packet)
+        with self._out_lock:
+            self._outq.append(_LEN.pack(len(payload)))
+            self._outq.append(payload)
+        self._out_ready.set()
+
+    def _writer(self):
+        while self.connected:
+            if not self._out_ready.wait(0.5):
+                continue
+            # Give packets sent in the same frame a moment to join this batch
+            time.sleep(0.005)
+            with self._out_lock:
+                self._out_ready.clear()
+                frames, self._outq = self._outq, []
             try:
-                send_msg(self.sock, packet)
-            except:
+                self.sock.sendall(b''.join(frames))
+            except OSError as e:
+                print(f"Send error: {e}")
                 self.connected = False
 
+    def send_chat(self, message):
+        self._send({"type": "chat", "message": message})
+
     def send_position(self, x, y):
-        if self.connected:
-            current_time = time.time()
-            if current_time - self.last_position_send > 0.05:  # Send max 20 times per second
-                packet = {"type": "move", "x": x, "y": y}
-                try:
-                    send_msg(self.sock, packet)
-                    self.last_position_send = current_time
-                except:
-                    self.connected = False
+        # Only record the position; _pos_flusher sends it at most 20 times per second
+        with self._pos_lock:
+            self._pending_pos = (x, y)
+
+    def _pos_flusher(self):
+        last_sent = None
+        last_sent_at = 0.0
+        latest = None
+        while self.connected:
+            time.sleep(0.05)
+            with self._pos_lock:
+                pos = self._pending_pos
+                self._pending_pos = None
+            if pos is not None:
+                latest = pos
+            if latest is None:
+                continue
+            # Skip sub-0.01 block jitter. Every 2 s send anyway: that settles on the exact
+            # position and doubles as a heartbeat, so a player standing still isn't timed out
+            now = time.monotonic()
+            if (last_sent is not None and now - last_sent_at < 2.0 and
+                    abs(latest[0] - last_sent[0]) + abs(latest[1] - last_sent[1]) < 0.01):
+                continue
+            self._send({"type": "move", "x": latest[0], "y": latest[1]})
+            last_sent = latest
+            last_sent_at = now
 
     def break_block(self, x, y):
-        if self.connected:
-            packet = {"type": "break_block", "x": x, "y": y}
-            try:
-                send_msg(self.sock, packet)
-            except:
-                self.connected = False
+        self._send({"type": "break_block", "x": x, "y": y})
 
     def place_block(self, x, y, slot):
-        if self.connected:
-            packet = {"type": "place_block", "x": x, "y": y, "slot": slot}
-            try:
-                send_msg(self.sock, packet)
-            except:
-                self.connected = False
+        self._send({"type": "place_block", "x": x, "y": y, "slot": slot})
 
     def update_color(self, color):
-        if self.connected:
-            packet = {"type": "update_color", "color": color}
-            try:
-                send_msg(self.sock, packet)
-            except:
-                self.connected = False
+        self._send({"type": "update_color", "color": color})
     
     def sync_inventory(self):
         """Sync inventory and hotbar to server after drag&drop"""
-        if self.connected:
-            packet = {
-                "type": "sync_inventory",
-                "hotbar": self.hotbar,
-                "inventory": self.inventory
-            }
-            try:
-                send_msg(self.sock, packet)
-            except:
-                self.connected = False
+        self._send({
+            "type": "sync_inventory",
+            "hotbar": self.hotbar,
+            "inventory": self.inventory
+        })
 
 # =========================
 # BUTTON CLASS
@@ -990,24 +1433,100 @@ class ServerConnection:
 class Button:
     def __init__(self, rect, text, color=(200,200,200)):
         self.rect = pygame.Rect(rect)
-        self.text = text
-        self.color = color
+        self._text = text
+        self._color = color
         self.hover = False
+        self._surfaces = [None, None]  # Pre-rendered [normal, hover] faces
+        self._overflow_label = None  # Label wider than the button, drawn on top
+    
+    @property
+    def text(self):
+        return self._text
+    
+    @text.setter
+    def text(self, value):
+        if value != self._text:
+            self._text = value
+            self._surfaces = [None, None]
+    
+    @property
+    def color(self):
+        return self._color
+    
+    @color.setter
+    def color(self, value):
+        if value != self._color:
+            self._color = value
+            self._surfaces = [None, None]
+    
+    def _render(self, hover):
+        """Bake background, border and label into one display-format surface"""
+        color = tuple(min(c + 30, 255) for c in self._color) if hover else self._color
+        face = pygame.Surface(self.rect.size).convert()
+        face.fill(color)
+        pygame.draw.rect(face, BLACK, face.get_rect(), 2)
+        label = render_text(self._text, 18, False, BLACK)
+        if label.get_width() > self.rect.width:
+            # Keep the old look of text spilling past the edges
+            self._overflow_label = label
+        else:
+            self._overflow_label = None
+            face.blit(label, label.get_rect(center=face.get_rect().center))
+        return face
     
     def draw(self, surf):
-        color = tuple(min(c + 30, 255) for c in self.color) if self.hover else self.color
-        pygame.draw.rect(surf, color, self.rect)
-        pygame.draw.rect(surf, BLACK, self.rect, 2)
-        label = font.render(self.text, True, BLACK)
-        text_rect = label.get_rect(center=self.rect.center)
-        surf.blit(label, text_rect)
+        index = 1 if self.hover else 0
+        face = self._surfaces[index]
+        if face is None:
+            face = self._surfaces[index] = self._render(self.hover)
+        surf.blit(face, self.rect)
+        if self._overflow_label:
+            surf.blit(self._overflow_label, self._overflow_label.get_rect(center=self.rect.center))
     
     def update(self, mouse_pos):
-        self.hover = self.rect.collidepoint(mouse_pos)
+        """Track hover; returns True when the hover state changed"""
+        hover = bool(self.rect.collidepoint(mouse_pos))
+        changed = hover != self.hover
+        self.hover = hover
+        return changed
     
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
 
+def draw_buttons(buttons, surf, mouse_pos):
+    """Update hover and draw a group of buttons in one pass"""
+    for btn in buttons:
+        btn.update(mouse_pos)
+        btn.draw(surf)
+
+def redraw_hover(buttons, surf, mouse_pos):
+    """Repaint only the buttons whose hover state changed; returns their rects for display.update"""
+    dirty = []
+    for btn in buttons:
+        if btn.update(mouse_pos):
+            btn.draw(surf)
+            dirty.append(btn.rect)
+    return dirty
+
+# Everything a menu reacts to; the expose event asks for a repaint
+MENU_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.VIDEOEXPOSE]
+
+# Everything the game loop reacts to; motion and window events are dropped unread
+GAME_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEWHEEL, pygame.MOUSEBUTTONDOWN]
+
+# Text fields also take committed text (typed characters, IME compositions)
+INPUT_EVENTS = MENU_EVENTS + [pygame.TEXTINPUT]
+
+def wait_events(timeout=33, types=MENU_EVENTS):
+    """Sleep until an event arrives (or timeout ms pass), then return the pending events of the given types"""
+    event = pygame.event.wait(timeout)
+    events = [event] if event.type in types else []
+    # Filter in C, then drop whatever this screen ignores without pumping
+    # again, so no input can arrive between the two calls and get lost
+    events += pygame.event.get(types)
+    pygame.event.clear(pump=False)
+    return events
+
 # =========================
 # MESSAGE BOX
 # =========================
@@ -1016,23 +1535,33 @@ def show_message(title, message):
     ok_btn = Button((SCREEN_WIDTH//2 - 50, SCREEN_HEIGHT//2 + 50, 100, 40), "OK")
     
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        screen.fill((30, 30, 30))
-        
-        # Title
-        title_surf = pygame.font.SysFont("Arial", 28, bold=True).render(title, True, WHITE)
-        screen.blit(title_surf, (SCREEN_WIDTH//2 - title_surf.get_width()//2, SCREEN_HEIGHT//2 - 80))
-        
-        # Message
-        msg_surf = font.render(message, True, WHITE)
-        screen.blit(msg_surf, (SCREEN_WIDTH//2 - msg_surf.get_width()//2, SCREEN_HEIGHT//2 - 20))
-        
-        ok_btn.update(mouse_pos)
-        ok_btn.draw(screen)
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            screen.fill((30, 30, 30))
+            
+            # Title
+            title_surf = render_text(title, 28, True, WHITE)
+            screen.blit(title_surf, (SCREEN_WIDTH//2 - title_surf.get_width()//2, SCREEN_HEIGHT//2 - 80))
+            
+            # Message
+            msg_surf = render_text(message, 18, False, WHITE)
+            screen.blit(msg_surf, (SCREEN_WIDTH//2 - msg_surf.get_width()//2, SCREEN_HEIGHT//2 - 20))
+            
+            ok_btn.update(mouse_pos)
+            ok_btn.draw(screen)
+            
+            pygame.display.flip()
+            needs_redraw = False
         
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1042,101 +1571,145 @@ def show_message(title, message):
                 if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
                     running = False
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if not needs_redraw:
+            dirty = redraw_hover([ok_btn], screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
 
 # =========================
 # TEXT INPUT BOX
 # =========================
-def text_input_box(prompt, width=400, height=35):
-    input_text = ""
-    active = True
-    box_rect = pygame.Rect(SCREEN_WIDTH//2 - width//2, SCREEN_HEIGHT//2, width, height)
-    ok_btn = Button((SCREEN_WIDTH//2 - 110, SCREEN_HEIGHT//2 + 60, 100, 40), t("ok"))
-    cancel_btn = Button((SCREEN_WIDTH//2 + 10, SCREEN_HEIGHT//2 + 60, 100, 40), t("back"))
-    
-    while active:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
+def multi_input_box(fields, width=400, height=35):
+    """Edit several (prompt, initial_text) fields in one dialog. Returns the list of texts or None"""
+    values = [initial for _, initial in fields]
+    current = 0
+    top = SCREEN_HEIGHT//2 - len(fields) * 40 - 40
+    box_rects = [pygame.Rect(SCREEN_WIDTH//2 - width//2, top + i * 80 + 30, width, height) for i in range(len(fields))]
+    buttons_y = top + len(fields) * 80 + 20
+    ok_btn = Button((SCREEN_WIDTH//2 - 110, buttons_y, 100, 40), t("ok"))
+    cancel_btn = Button((SCREEN_WIDTH//2 + 10, buttons_y, 100, 40), t("back"))
+    
+    needs_redraw = True
+    shown_cursor = None
+    text_surfaces = [None] * len(fields)  # Rendered values, dropped when a value changes
+    mouse_pos = pygame.mouse.get_pos()
+    pygame.key.start_text_input()
+    while True:
+        for event in wait_events(types=INPUT_EVENTS):
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 return None
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN:
-                    return input_text
+                    # Enter moves through the fields like the old chained prompts did
+                    if current == len(fields) - 1:
+                        return values
+                    current += 1
                 elif event.key == pygame.K_ESCAPE:
                     return None
+                elif event.key == pygame.K_TAB:
+                    step = -1 if event.mod & pygame.KMOD_SHIFT else 1
+                    current = (current + step) % len(fields)
                 elif event.key == pygame.K_BACKSPACE:
-                    input_text = input_text[:-1]
-                else:
-                    if len(input_text) < 50:
-                        input_text += event.unicode
+                    values[current] = values[current][:-1]
+                    text_surfaces[current] = None
+            elif event.type == pygame.TEXTINPUT:
+                values[current] = (values[current] + event.text)[:50]
+                text_surfaces[current] = None
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if ok_btn.is_clicked(event.pos):
-                    return input_text
+                    return values
                 elif cancel_btn.is_clicked(event.pos):
                     return None
+                for i, rect in enumerate(box_rects):
+                    if rect.collidepoint(event.pos):
+                        current = i
         
-        screen.fill((50,50,50))
-        
-        # Draw prompt
-        label = font.render(prompt, True, WHITE)
-        screen.blit(label, (SCREEN_WIDTH//2 - label.get_width()//2, SCREEN_HEIGHT//2 - 50))
-        
-        # Draw input box
-        pygame.draw.rect(screen, WHITE, box_rect)
-        pygame.draw.rect(screen, BLACK, box_rect, 2)
-        
-        # Draw text
-        text_surface = font.render(input_text, True, BLACK)
-        screen.blit(text_surface, (box_rect.x + 5, box_rect.y + 8))
-        
-        # Draw cursor
-        if int(time.time() * 2) % 2:
-            cursor_x = box_rect.x + 5 + text_surface.get_width()
-            pygame.draw.line(screen, BLACK, (cursor_x, box_rect.y + 5), (cursor_x, box_rect.y + height - 5), 2)
+        # The blinking cursor is the only thing that changes without input
+        cursor_visible = pygame.time.get_ticks() // 500 % 2
+        if cursor_visible != shown_cursor:
+            needs_redraw = True
         
-        # Draw buttons
-        ok_btn.update(mouse_pos)
-        cancel_btn.update(mouse_pos)
-        ok_btn.draw(screen)
-        cancel_btn.draw(screen)
-        
-        pygame.display.flip()
-        clock.tick(FPS)
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            screen.fill((50,50,50))
+            
+            for i, ((prompt, _), box_rect) in enumerate(zip(fields, box_rects)):
+                # Draw prompt
+                label = render_text(prompt, 18, False, WHITE)
+                screen.blit(label, (SCREEN_WIDTH//2 - label.get_width()//2, box_rect.y - 28))
+                
+                # Draw input box, highlighting the one being edited
+                pygame.draw.rect(screen, WHITE, box_rect)
+                pygame.draw.rect(screen, (255, 255, 100) if i == current else BLACK, box_rect, 2)
+                
+                # Draw text
+                text_surface = text_surfaces[i]
+                if text_surface is None:
+                    text_surface = text_surfaces[i] = font.render(values[i], True, BLACK)
+                screen.blit(text_surface, (box_rect.x + 5, box_rect.y + 8))
+                
+                # Draw cursor
+                if i == current and cursor_visible:
+                    cursor_x = box_rect.x + 5 + text_surface.get_width()
+                    pygame.draw.line(screen, BLACK, (cursor_x, box_rect.y + 5), (cursor_x, box_rect.y + height - 5), 2)
+            shown_cursor = cursor_visible
+            
+            # Draw buttons
+            draw_buttons([ok_btn, cancel_btn], screen, mouse_pos)
+            
+            pygame.display.flip()
+            needs_redraw = False
+        else:
+            dirty = redraw_hover([ok_btn, cancel_btn], screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
 
 # =========================
 # MAIN MENU
 # =========================
 def main_menu():
+    layout = None
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Create buttons dynamically centered
-        play_btn = Button((SCREEN_WIDTH//2-75, 250, 150, 50), t("play"))
-        settings_btn = Button((SCREEN_WIDTH//2-75, 320, 150, 50), t("settings"))
-        exit_btn = Button((SCREEN_WIDTH//2-75, 390, 150, 50), t("exit"))
-        
-        screen.fill((40, 40, 70))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 48, bold=True).render(t("title"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 120))
-        
-        # Player ID
-        id_text = font.render(f"{t('your_id')}: {PLAYER_ID}", True, (255, 255, 100))
-        screen.blit(id_text, (SCREEN_WIDTH//2 - id_text.get_width()//2, 180))
-        
-        play_btn.update(mouse_pos)
-        settings_btn.update(mouse_pos)
-        exit_btn.update(mouse_pos)
-        
-        play_btn.draw(screen)
-        settings_btn.draw(screen)
-        exit_btn.draw(screen)
+        # Buttons are centered and translated: rebuild them only when resolution or language changes
+        if layout != (SCREEN_WIDTH, SCREEN_HEIGHT, CURRENT_LANG):
+            layout = (SCREEN_WIDTH, SCREEN_HEIGHT, CURRENT_LANG)
+            play_btn = Button((SCREEN_WIDTH//2-75, 250, 150, 50), t("play"))
+            settings_btn = Button((SCREEN_WIDTH//2-75, 320, 150, 50), t("settings"))
+            exit_btn = Button((SCREEN_WIDTH//2-75, 390, 150, 50), t("exit"))
+            buttons = [play_btn, settings_btn, exit_btn]
+        
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            screen.fill((40, 40, 70))
+            
+            # Title
+            title = render_text(t("title"), 48, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 120))
+            
+            # Player ID
+            id_text = render_text(f"{t('your_id')}: {PLAYER_ID}", 18, False, (255, 255, 100))
+            screen.blit(id_text, (SCREEN_WIDTH//2 - id_text.get_width()//2, 180))
+            
+            draw_buttons(buttons, screen, mouse_pos)
+            
+            pygame.display.flip()
+            needs_redraw = False
         
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1147,8 +1720,10 @@ def main_menu():
                 elif exit_btn.is_clicked(event.pos):
                     return False
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
     
     return False
 
@@ -1156,39 +1731,41 @@ def main_menu():
 # SETTINGS SCREEN
 # =========================
 def settings_screen():
+    layout = None
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
+        # Buttons are centered and translated: rebuild them only when resolution or language changes
+        if layout != (SCREEN_WIDTH, SCREEN_HEIGHT, CURRENT_LANG):
+            layout = (SCREEN_WIDTH, SCREEN_HEIGHT, CURRENT_LANG)
+            controls_btn = Button((SCREEN_WIDTH//2-100, 150, 200, 50), t("controls"))
+            appearance_btn = Button((SCREEN_WIDTH//2-100, 210, 200, 50), t("appearance"))
+            video_btn = Button((SCREEN_WIDTH//2-100, 270, 200, 50), t("video"))
+            texture_btn = Button((SCREEN_WIDTH//2-100, 330, 200, 50), t("texture_packs"))
+            language_btn = Button((SCREEN_WIDTH//2-100, 390, 200, 50), t("language"))
+            back_btn = Button((50, 30, 100, 40), t("back"))
+            buttons = [controls_btn, appearance_btn, video_btn, texture_btn, language_btn, back_btn]
+        
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            screen.fill((30,30,30))
+            
+            # Title
+            title = render_text(t("settings"), 36, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
+            
+            draw_buttons(buttons, screen, mouse_pos)
+            
+            pygame.display.flip()
+            needs_redraw = False
         
-        # Create buttons dynamically centered
-        controls_btn = Button((SCREEN_WIDTH//2-100, 150, 200, 50), t("controls"))
-        appearance_btn = Button((SCREEN_WIDTH//2-100, 210, 200, 50), t("appearance"))
-        video_btn = Button((SCREEN_WIDTH//2-100, 270, 200, 50), t("video"))
-        texture_btn = Button((SCREEN_WIDTH//2-100, 330, 200, 50), t("texture_packs"))
-        language_btn = Button((SCREEN_WIDTH//2-100, 390, 200, 50), t("language"))
-        back_btn = Button((50, 30, 100, 40), t("back"))
-        
-        screen.fill((30,30,30))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 36, bold=True).render(t("settings"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        
-        controls_btn.update(mouse_pos)
-        appearance_btn.update(mouse_pos)
-        video_btn.update(mouse_pos)
-        texture_btn.update(mouse_pos)
-        language_btn.update(mouse_pos)
-        back_btn.update(mouse_pos)
-        
-        controls_btn.draw(screen)
-        appearance_btn.draw(screen)
-        video_btn.draw(screen)
-        texture_btn.draw(screen)
-        language_btn.draw(screen)
-        back_btn.draw(screen)
-        
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1204,13 +1781,16 @@ def settings_screen():
                     texture_packs_screen()
                 elif language_btn.is_clicked(event.pos):
                     language_screen()
-        
-        pygame.display.flip()
-        clock.tick(FPS)
+
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
 
 # =========================
 # CONTROLS SCREEN
 # =========================
+@functools.lru_cache(maxsize=512)
 def get_key_name(key):
     if isinstance(key, int):
         if key >= 1 and key <= 3:
@@ -1218,6 +1798,22 @@ def get_key_name(key):
         return pygame.key.name(key).upper()
     return str(key)
 
+def game_bindings():
+    """Resolve the controls game_screen reads each frame into a tuple."""
+    return (
+        controls.get("chat", pygame.K_t),
+        controls.get("inventory", pygame.K_e),
+        controls.get("break_block", 1),
+        controls.get("place_block", 3),
+        controls.get("sprint", pygame.K_LSHIFT),
+        controls.get("climb_up", pygame.K_w),
+        controls.get("climb_down", pygame.K_s),
+        controls.get("move_left", pygame.K_a),
+        controls.get("move_right", pygame.K_d),
+        controls.get("jump", pygame.K_SPACE),
+        controls.get("player_list", pygame.K_TAB),
+    )
+
 def controls_screen():
     global controls
     
@@ -1240,56 +1836,53 @@ def controls_screen():
     
     waiting_for_key = None
     
+    rows_key = None
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Update button texts
-        back_btn.text = t("back")
-        reset_btn.text = t("reset")
-        
-        screen.fill((30,30,30))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 36, bold=True).render(t("controls"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        
-        back_btn.update(mouse_pos)
-        reset_btn.update(mouse_pos)
-        
-        back_btn.draw(screen)
-        reset_btn.draw(screen)
+        # Key buttons only change when a binding or the key being captured does
+        bindings = tuple(controls.get(action, DEFAULT_CONTROLS[action]) for action, _ in control_actions)
+        if rows_key != (bindings, waiting_for_key):
+            rows_key = (bindings, waiting_for_key)
+            control_btns = []
+            for i, ((action, _), current_key) in enumerate(zip(control_actions, bindings)):
+                if waiting_for_key == action:
+                    key_btn = Button((500, 175 + i * 60, 150, 35), t("press_key"), (255, 200, 100))
+                else:
+                    key_btn = Button((500, 175 + i * 60, 150, 35), get_key_name(current_key), (150, 150, 200))
+                control_btns.append((key_btn, action))
+            buttons = [back_btn, reset_btn] + [btn for btn, _ in control_btns]
+            needs_redraw = True
         
-        # Draw controls
-        y = 180
-        control_btns = []
-        for action, translation_key in control_actions:
-            # Action name (translated)
-            action_text = font.render(t(translation_key) + ":", True, WHITE)
-            screen.blit(action_text, (200, y))
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
             
-            # Current key button
-            current_key = controls.get(action, DEFAULT_CONTROLS[action])
-            key_name = get_key_name(current_key)
+            screen.fill((30,30,30))
             
-            if waiting_for_key == action:
-                key_name = t("press_key")
-                color = (255, 200, 100)
-            else:
-                color = (150, 150, 200)
+            # Title
+            title = render_text(t("controls"), 36, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
             
-            key_btn = Button((500, y - 5, 150, 35), key_name, color)
-            key_btn.update(mouse_pos)
-            key_btn.draw(screen)
-            control_btns.append((key_btn, action))
+            # Action names (translated)
+            for i, (_, translation_key) in enumerate(control_actions):
+                action_text = render_text(t(translation_key) + ":", 18, False, WHITE)
+                screen.blit(action_text, (200, 180 + i * 60))
             
-            y += 60
-        
-        if waiting_for_key:
-            info_text = small_font.render(t("press_esc_cancel"), True, (255, 255, 100))
-            screen.blit(info_text, (SCREEN_WIDTH//2 - info_text.get_width()//2, SCREEN_HEIGHT - 50))
+            draw_buttons(buttons, screen, mouse_pos)
+            
+            if waiting_for_key:
+                info_text = render_text(t("press_esc_cancel"), 14, False, (255, 255, 100))
+                screen.blit(info_text, (SCREEN_WIDTH//2 - info_text.get_width()//2, SCREEN_HEIGHT - 50))
+            
+            pygame.display.flip()
+            needs_redraw = False
         
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1297,7 +1890,7 @@ def controls_screen():
                     if event.button <= 3:  # Left, Middle, Right mouse buttons
                         controls[waiting_for_key] = event.button
                         settings["controls"] = controls
-                        save_settings(settings)
+                        save_later(save_settings, settings)
                         waiting_for_key = None
                 else:
                     if back_btn.is_clicked(event.pos):
@@ -1305,7 +1898,7 @@ def controls_screen():
                     elif reset_btn.is_clicked(event.pos):
                         controls = DEFAULT_CONTROLS.copy()
                         settings["controls"] = controls
-                        save_settings(settings)
+                        save_later(save_settings, settings)
                     else:
                         for btn, action in control_btns:
                             if btn.is_clicked(event.pos):
@@ -1318,11 +1911,13 @@ def controls_screen():
                     else:
                         controls[waiting_for_key] = event.key
                         settings["controls"] = controls
-                        save_settings(settings)
+                        save_later(save_settings, settings)
                         waiting_for_key = None
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
 
 # =========================
 # LANGUAGE SCREEN
@@ -1345,34 +1940,43 @@ def language_screen():
     for i, (lang_code, lang_name) in enumerate(languages):
         btn = Button((SCREEN_WIDTH//2 - 150, start_y + i * 80, 300, 60), lang_name)
         lang_buttons.append((lang_code, lang_name, btn))
+    buttons = [back_btn] + [btn for _, _, btn in lang_buttons]
     
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        back_btn.text = t("back")
-        
-        screen.fill((30,30,30))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 36, bold=True).render(t("language"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        
-        back_btn.update(mouse_pos)
-        back_btn.draw(screen)
-        
-        # Draw language buttons
-        current_lang = settings.get("language", DEFAULT_LANGUAGE)
-        for lang_code, lang_name, btn in lang_buttons:
-            # Highlight selected language
-            if lang_code == current_lang:
-                highlight = pygame.Rect(btn.rect.x - 5, btn.rect.y - 5, btn.rect.width + 10, btn.rect.height + 10)
-                pygame.draw.rect(screen, (255, 255, 100), highlight, 4)
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            screen.fill((30,30,30))
+            
+            # Title
+            title = render_text(t("language"), 36, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
+            
+            back_btn.update(mouse_pos)
+            back_btn.draw(screen)
+            
+            # Draw language buttons
+            current_lang = CURRENT_LANG
+            for lang_code, lang_name, btn in lang_buttons:
+                # Highlight selected language
+                if lang_code == current_lang:
+                    highlight = pygame.Rect(btn.rect.x - 5, btn.rect.y - 5, btn.rect.width + 10, btn.rect.height + 10)
+                    pygame.draw.rect(screen, (255, 255, 100), highlight, 4)
+                
+                btn.update(mouse_pos)
+                btn.draw(screen)
             
-            btn.update(mouse_pos)
-            btn.draw(screen)
+            pygame.display.flip()
+            needs_redraw = False
         
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1382,10 +1986,15 @@ def language_screen():
                     for lang_code, lang_name, btn in lang_buttons:
                         if btn.is_clicked(event.pos):
                             settings["language"] = lang_code
-                            save_settings(settings)
+                            set_language(lang_code)
+                            save_later(save_settings, settings)
+                            # The only label on this screen that is translated
+                            back_btn.text = t("back")
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
 
 # =========================
 # VIDEO SETTINGS SCREEN
@@ -1406,54 +2015,57 @@ def video_settings_screen():
     current_res = settings.get("video", DEFAULT_VIDEO).get("resolution", "1200x700")
     current_fullscreen = settings.get("video", DEFAULT_VIDEO).get("fullscreen", False)
     
+    # Buttons are centered; the resolution only changes when leaving via Apply
+    y = 180
+    back_btn = Button((50, 30, 100, 40), t("back"))
+    res_buttons = []
+    for i, res in enumerate(resolutions):
+        btn_y = y + 40 + i * 45
+        res_buttons.append((Button((SCREEN_WIDTH//2 - 75, btn_y, 150, 35), res), res))
+    fs_y = y + 40 + len(resolutions) * 45 + 20
+    fs_btn = Button((SCREEN_WIDTH//2 - 75, fs_y - 5, 150, 35), "")
+    apply_btn = Button((SCREEN_WIDTH//2 - 75, SCREEN_HEIGHT - 100, 150, 50), t("apply"), (100, 200, 255))
+    
+    buttons = [back_btn] + [btn for btn, _ in res_buttons] + [fs_btn, apply_btn]
+    
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            screen.fill((30,30,30))
+            
+            # Title
+            title = render_text(t("video"), 36, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
+            
+            # Resolution selection - centered
+            res_label = render_text(t("resolution") + ":", 18, False, WHITE)
+            screen.blit(res_label, (SCREEN_WIDTH//2 - 200, y))
+            
+            for btn, res in res_buttons:
+                is_current = (res == current_res)
+                btn.color = (100, 255, 100) if is_current else (200, 200, 200)
+            
+            # Fullscreen toggle - centered
+            fs_label = render_text(t("fullscreen") + ":", 18, False, WHITE)
+            screen.blit(fs_label, (SCREEN_WIDTH//2 - 200, fs_y))
+            
+            fs_btn.text = t("fullscreen") if current_fullscreen else t("windowed")
+            fs_btn.color = (100, 255, 100) if current_fullscreen else (255, 200, 100)
+            
+            draw_buttons(buttons, screen, mouse_pos)
+            
+            pygame.display.flip()
+            needs_redraw = False
         
-        # Create buttons dynamically centered
-        back_btn = Button((50, 30, 100, 40), t("back"))
-        
-        screen.fill((30,30,30))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 36, bold=True).render(t("video"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        
-        back_btn.update(mouse_pos)
-        back_btn.draw(screen)
-        
-        # Resolution selection - centered
-        y = 180
-        res_label = font.render(t("resolution") + ":", True, WHITE)
-        screen.blit(res_label, (SCREEN_WIDTH//2 - 200, y))
-        
-        res_buttons = []
-        for i, res in enumerate(resolutions):
-            btn_y = y + 40 + i * 45
-            is_current = (res == current_res)
-            color = (100, 255, 100) if is_current else (200, 200, 200)
-            btn = Button((SCREEN_WIDTH//2 - 75, btn_y, 150, 35), res, color)
-            btn.update(mouse_pos)
-            btn.draw(screen)
-            res_buttons.append((btn, res))
-        
-        # Fullscreen toggle - centered
-        fs_y = y + 40 + len(resolutions) * 45 + 20
-        fs_label = font.render(t("fullscreen") + ":", True, WHITE)
-        screen.blit(fs_label, (SCREEN_WIDTH//2 - 200, fs_y))
-        
-        fs_text = t("fullscreen") if current_fullscreen else t("windowed")
-        fs_color = (100, 255, 100) if current_fullscreen else (255, 200, 100)
-        fs_btn = Button((SCREEN_WIDTH//2 - 75, fs_y - 5, 150, 35), fs_text, fs_color)
-        fs_btn.update(mouse_pos)
-        fs_btn.draw(screen)
-        
-        # Apply button - centered
-        apply_btn = Button((SCREEN_WIDTH//2 - 75, SCREEN_HEIGHT - 100, 150, 50), t("apply"), (100, 200, 255))
-        apply_btn.update(mouse_pos)
-        apply_btn.draw(screen)
-        
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1478,7 +2090,7 @@ def video_settings_screen():
                         "resolution": current_res,
                         "fullscreen": current_fullscreen
                     }
-                    save_settings(settings)
+                    save_later(save_settings, settings)
                     running = False
                 elif fs_btn.is_clicked(event.pos):
                     current_fullscreen = not current_fullscreen
@@ -1487,8 +2099,10 @@ def video_settings_screen():
                         if btn.is_clicked(event.pos):
                             current_res = res
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
 
 # =========================
 # TEXTURE PACKS SCREEN
@@ -1498,46 +2112,51 @@ def texture_packs_screen():
     
     back_btn = Button((50, 30, 100, 40), t("back"))
     
-    # Get available packs
-    packs = get_available_texture_packs()
-    if not packs:
-        packs = ["default"]  # At least show default
+    # Get available packs; the folder is only scanned when the screen opens
+    found_packs = get_available_texture_packs()
+    packs = found_packs or ["default"]  # At least show default
     
+    shown_pack = None
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        back_btn.text = t("back")
-        
-        screen.fill((30,30,30))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 36, bold=True).render(t("texture_packs"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        
-        back_btn.update(mouse_pos)
-        back_btn.draw(screen)
-        
-        # Pack buttons
-        y = 180
-        pack_buttons = []
-        for pack_name in packs:
-            is_current = (pack_name == current_texture_pack)
-            color = (100, 255, 100) if is_current else (200, 200, 200)
+        # Pack buttons only change color when the current pack does
+        if shown_pack != current_texture_pack:
+            shown_pack = current_texture_pack
+            pack_buttons = []
+            for i, pack_name in enumerate(packs):
+                is_current = (pack_name == current_texture_pack)
+                color = (100, 255, 100) if is_current else (200, 200, 200)
+                btn = Button((SCREEN_WIDTH//2 - 150, 180 + i * 60, 300, 50), pack_name.capitalize(), color)
+                pack_buttons.append((btn, pack_name))
+            buttons = [back_btn] + [btn for btn, _ in pack_buttons]
+            needs_redraw = True
+        
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
             
-            btn = Button((SCREEN_WIDTH//2 - 150, y, 300, 50), pack_name.capitalize(), color)
-            btn.update(mouse_pos)
-            btn.draw(screen)
-            pack_buttons.append((btn, pack_name))
+            screen.fill((30,30,30))
             
-            y += 60
-        
-        # Info text
-        if not get_available_texture_packs():
-            info_text = small_font.render("Nessun texture pack trovato in /textures/", True, (255, 200, 100))
-            screen.blit(info_text, (SCREEN_WIDTH//2 - info_text.get_width()//2, y + 20))
+            # Title
+            title = render_text(t("texture_packs"), 36, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
+            
+            draw_buttons(buttons, screen, mouse_pos)
+            
+            # Info text
+            if not found_packs:
+                info_text = render_text("Nessun texture pack trovato in /textures/", 14, False, (255, 200, 100))
+                screen.blit(info_text, (SCREEN_WIDTH//2 - info_text.get_width()//2, 180 + len(packs) * 60 + 20))
+            
+            pygame.display.flip()
+            needs_redraw = False
         
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1548,90 +2167,135 @@ def texture_packs_screen():
                         if btn.is_clicked(event.pos):
                             load_texture_pack(pack_name)
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
 
 # =========================
 # APPEARANCE SCREEN
 # =========================
-def appearance_screen(active_connection=None):
-    global appearance
-    
-    back_btn = Button((50, 30, 100, 40), t("back"))
+# Swatch layout only depends on the window width and the language (for the
+# color names), so it is built once and reused across visits to the screen
+_color_buttons_key = None
+_color_buttons = []
+SWATCH_COLS = 4
+SWATCH_PITCH = 100  # Grid spacing, both ways
+SWATCH_TOP = 200
+
+def _swatch_start_x():
+    return SCREEN_WIDTH // 2 - (SWATCH_COLS * SWATCH_PITCH) // 2
+
+def _color_index_at(pos):
+    """Grid hit test for the swatches: index into the color list, or None"""
+    col, dx = divmod(pos[0] - _swatch_start_x(), SWATCH_PITCH)
+    row, dy = divmod(pos[1] - SWATCH_TOP, SWATCH_PITCH)
+    if 0 <= col < SWATCH_COLS and row >= 0 and dx < 80 and dy < 60:
+        index = row * SWATCH_COLS + col
+        if index < len(PLAYER_COLORS):
+            return index
+    return None
+
+def _get_color_buttons():
+    global _color_buttons_key, _color_buttons
+    if _color_buttons_key == (SCREEN_WIDTH, CURRENT_LANG):
+        return _color_buttons
     
     color_buttons = []
     colors = list(PLAYER_COLORS.keys())
-    cols = 4
-    start_x = SCREEN_WIDTH // 2 - (cols * 100) // 2
-    start_y = 200
+    start_x = _swatch_start_x()
     
     for i, color_name in enumerate(colors):
-        row = i // cols
-        col = i % cols
-        x = start_x + col * 100
-        y = start_y + row * 100  # Increased from 80 to 100 for more spacing
-        color_buttons.append((color_name, pygame.Rect(x, y, 80, 60)))
+        row = i // SWATCH_COLS
+        col = i % SWATCH_COLS
+        x = start_x + col * SWATCH_PITCH
+        y = SWATCH_TOP + row * SWATCH_PITCH  # Increased from 80 to 100 for more spacing
+        rect = pygame.Rect(x, y, 80, 60)
+        
+        # Pre-compose the player preview; it never changes on this screen
+        swatch = pygame.Surface((40, 60)).convert()
+        # Body (bottom half)
+        pygame.draw.rect(swatch, PLAYER_COLORS[color_name], (0, 30, 40, 30))
+        pygame.draw.rect(swatch, BLACK, (0, 30, 40, 30), 2)
+        # Head (top half)
+        pygame.draw.rect(swatch, PINK, (0, 0, 40, 30))
+        pygame.draw.rect(swatch, BLACK, (0, 0, 40, 30), 2)
+        
+        # Color name (translated if available)
+        translated_name = t(color_name) if t(color_name) != color_name else color_name.capitalize()
+        name_text = render_text(translated_name, 14, False, WHITE)
+        name_rect = name_text.get_rect(center=(rect.centerx, rect.bottom + 18))  # Increased spacing
+        
+        color_buttons.append((color_name, rect, swatch, name_text, name_rect))
+    
+    _color_buttons_key = (SCREEN_WIDTH, CURRENT_LANG)
+    _color_buttons = color_buttons
+    return color_buttons
+
+def appearance_screen(active_connection=None):
+    global appearance
+    
+    back_btn = Button((50, 30, 100, 40), t("back"))
+    
+    color_buttons = _get_color_buttons()
     
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        back_btn.text = t("back")
-        
-        screen.fill((30,30,30))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 36, bold=True).render(t("player_appearance"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        
-        back_btn.update(mouse_pos)
-        back_btn.draw(screen)
-        
-        # Draw color selection buttons with preview
-        for color_name, rect in color_buttons:
-            # Draw button background
-            if appearance.get("player_color") == color_name:
-                pygame.draw.rect(screen, (255, 255, 100), rect.inflate(6, 6))
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            screen.fill((30,30,30))
             
-            # Draw player preview
-            body_color = PLAYER_COLORS[color_name]
-            head_color = PINK
+            # Title
+            title = render_text(t("player_appearance"), 36, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
             
-            # Body (bottom half)
-            body_rect = pygame.Rect(rect.x + 20, rect.y + 30, 40, 30)
-            pygame.draw.rect(screen, body_color, body_rect)
-            pygame.draw.rect(screen, BLACK, body_rect, 2)
+            back_btn.update(mouse_pos)
+            back_btn.draw(screen)
             
-            # Head (top half)
-            head_rect = pygame.Rect(rect.x + 20, rect.y, 40, 30)
-            pygame.draw.rect(screen, head_color, head_rect)
-            pygame.draw.rect(screen, BLACK, head_rect, 2)
+            # Draw color selection buttons with preview: highlight, then every swatch and name at once
+            for color_name, rect, swatch, name_text, name_rect in color_buttons:
+                if CURRENT_COLOR == color_name:
+                    pygame.draw.rect(screen, (255, 255, 100), rect.inflate(6, 6))
+            screen.blits([
+                item
+                for _, rect, swatch, name_text, name_rect in color_buttons
+                for item in ((swatch, (rect.x + 20, rect.y)), (name_text, name_rect))
+            ], doreturn=False)
             
-            # Color name (translated if available)
-            translated_name = t(color_name) if t(color_name) != color_name else color_name.capitalize()
-            name_text = small_font.render(translated_name, True, WHITE)
-            name_rect = name_text.get_rect(center=(rect.centerx, rect.bottom + 18))  # Increased spacing
-            screen.blit(name_text, name_rect)
+            pygame.display.flip()
+            needs_redraw = False
         
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if back_btn.is_clicked(event.pos):
                     running = False
                 else:
-                    for color_name, rect in color_buttons:
-                        if rect.collidepoint(event.pos):
-                            appearance["player_color"] = color_name
-                            settings["appearance"] = appearance
-                            save_settings(settings)
-                            
-                            # If connected to a server, send color update
-                            if active_connection and active_connection.connected:
-                                active_connection.update_color(color_name)
-        
-        pygame.display.flip()
-        clock.tick(FPS)
+                    index = _color_index_at(event.pos)
+                    if index is not None:
+                        color_name = color_buttons[index][0]
+                        set_player_color(color_name)
+                        save_later(save_settings, settings)
+                        
+                        # If connected to a server, send color update
+                        if active_connection and active_connection.connected:
+                            active_connection.update_color(color_name)
+
+        if not needs_redraw:
+            dirty = redraw_hover([back_btn], screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
+    
+    # Write the pick now instead of leaving it to the timer
+    flush_saves()
 
 # =========================
 # SERVER LIST SCREEN
@@ -1640,76 +2304,101 @@ def server_list_screen():
     add_btn = Button((SCREEN_WIDTH-220, 30, 150, 40), t("add_server"))
     refresh_btn = Button((SCREEN_WIDTH-220, 80, 150, 40), t("refresh"))
     back_btn = Button((50, 30, 100, 40), t("back"))
+    # Language can't change from this screen, so its labels are translated once
+    id_label = render_text(f"{t('your_id')}: {PLAYER_ID}", 18, False, (255,255,100))
     
     running = True
+    rows = None
+    scroll = 0  # Index of the first server row shown
+    refresh_thread = None
+    probe_results = queue.SimpleQueue()  # (s, key, fields) from refresh_servers
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Update button texts
-        add_btn.text = t("add_server")
-        refresh_btn.text = t("refresh")
-        back_btn.text = t("back")
-        
-        screen.fill((50,50,80))
-        
-        # Player ID
-        id_label = font.render(f"{t('your_id')}: {PLAYER_ID}", True, (255,255,100))
-        screen.blit(id_label, (SCREEN_WIDTH//2 - id_label.get_width()//2, 10))
-        
-        add_btn.update(mouse_pos)
-        refresh_btn.update(mouse_pos)
-        back_btn.update(mouse_pos)
-        
-        add_btn.draw(screen)
-        refresh_btn.draw(screen)
-        back_btn.draw(screen)
-
-        # Lista server
-        y = 150
-        server_buttons = []
-        for s in servers:
-            name = s.get('name', '???')
-            motd = s.get('motd', '???')
-            current = s.get('current', 0)
-            max_p = s.get('max', 10)
+        # Only the rows that fit between the header and the bottom edge are built and drawn
+        visible_rows = max(1, (SCREEN_HEIGHT - 170) // 40)
+        scroll = max(0, min(scroll, len(servers) - visible_rows))
+        
+        # Probe answers are applied here, on the UI thread, as they arrive
+        if refresh_thread is not None:
+            # Check liveness first so answers queued just before the thread ended aren't missed
+            finished = not refresh_thread.is_alive()
+            if apply_probe_results(probe_results):
+                needs_redraw = True
+            if finished:
+                refresh_thread = None
+                refresh_btn.text = t("refresh")
+                needs_redraw = True
+                save_later(save_servers, servers)
+        
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
             
-            text = f"{s['ip']}:{s['port']} - {name} - {motd} - {current}/{max_p}"
-            label = small_font.render(text, True, WHITE)
-            screen.blit(label, (50, y))
+            # Row buttons only move when servers are added or removed, or the list scrolls
+            if rows != (SCREEN_WIDTH, tuple(map(id, servers)), scroll):
+                rows = (SCREEN_WIDTH, tuple(map(id, servers)), scroll)
+                server_buttons = []
+                for i, s in enumerate(servers[scroll:scroll + visible_rows]):
+                    y = 150 + i * 40
+                    join_btn = Button((SCREEN_WIDTH-380, y-3, 70, 30), t("join"), (100, 200, 100))
+                    modify_btn = Button((SCREEN_WIDTH-300, y-3, 70, 30), t("modify"), (200, 200, 100))
+                    delete_btn = Button((SCREEN_WIDTH-220, y-3, 70, 30), t("delete"), (200, 100, 100))
+                    # Last [key, label] rendered for this row; kept here, not in s, since s is saved as JSON
+                    server_buttons.append((join_btn, modify_btn, delete_btn, s, [None, None]))
+                buttons = [add_btn, refresh_btn, back_btn]
+                for join_btn, modify_btn, delete_btn, _, _ in server_buttons:
+                    buttons += (join_btn, modify_btn, delete_btn)
             
-            join_btn = Button((SCREEN_WIDTH-380, y-3, 70, 30), t("join"), (100, 200, 100))
-            modify_btn = Button((SCREEN_WIDTH-300, y-3, 70, 30), t("modify"), (200, 200, 100))
-            delete_btn = Button((SCREEN_WIDTH-220, y-3, 70, 30), t("delete"), (200, 100, 100))
+            screen.fill((50,50,80))
             
-            join_btn.update(mouse_pos)
-            modify_btn.update(mouse_pos)
-            delete_btn.update(mouse_pos)
+            # Player ID and the server rows' labels go out in one blits() call, buttons on top
+            labels = [(id_label, (SCREEN_WIDTH//2 - id_label.get_width()//2, 10))]
             
-            join_btn.draw(screen)
-            modify_btn.draw(screen)
-            delete_btn.draw(screen)
+            # Lista server
+            for join_btn, modify_btn, delete_btn, s, row_label in server_buttons:
+                key = (s['ip'], s['port'], s.get('name', '???'), s.get('motd', '???'), s.get('current', 0), s.get('max', 10))
+                if key != row_label[0]:
+                    ip, port, name, motd, current, max_p = key
+                    text = f"{ip}:{port} - {name} - {motd} - {current}/{max_p}"
+                    row_label[:] = [key, render_text(text, 14, False, WHITE)]
+                labels.append((row_label[1], (50, join_btn.rect.y + 3)))
+            screen.blits(labels, doreturn=False)
             
-            server_buttons.append((join_btn, modify_btn, delete_btn, s))
-            y += 40
-
-        for event in pygame.event.get():
+            draw_buttons(buttons, screen, mouse_pos)
+            
+            pygame.display.flip()
+            needs_redraw = False
+        
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
+                # Mouse wheel scrolls the list; it must not click the rows under it
+                scroll += 1 if event.button == 5 else -1
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if back_btn.is_clicked(event.pos):
                     running = False
                 elif add_btn.is_clicked(event.pos):
                     add_server_dialog()
                 elif refresh_btn.is_clicked(event.pos):
-                    refresh_servers()
+                    if refresh_thread is None:
+                        # Snapshot what to ask here; the probe threads never read the live list
+                        targets = [(s, _server_key(s)) for s in servers]
+                        refresh_thread = threading.Thread(target=refresh_servers, args=(targets, probe_results), daemon=True)
+                        refresh_thread.start()
+                        refresh_btn.text = t("refreshing")
                 else:
-                    for join_btn, modify_btn, delete_btn, s in server_buttons:
+                    for join_btn, modify_btn, delete_btn, s, _ in server_buttons:
                         if join_btn.is_clicked(event.pos):
                             try:
                                 conn = ServerConnection(s['ip'], s['port'], s.get('password', '0'))
                                 if conn.connect():
                                     # Wait a bit to see if we get disconnected
-                                    time.sleep(0.3)
+                                    conn.ready_event.wait(timeout=0.3)
                                     if not conn.connected:
                                         # We were disconnected, show reason
                                         reason = conn.disconnect_reason or t("connection_failed")
@@ -1721,49 +2410,54 @@ def server_list_screen():
                                     s['motd'] = t("server_offline")
                                     s['current'] = 0
                                     s['max'] = 0
+                                    _probe_cache.pop(_server_key(s), None)
                             except Exception as e:
                                 print(f"Failed to connect: {e}")
                                 s['name'] = t("offline")
                                 s['motd'] = t("server_offline")
                                 s['current'] = 0
                                 s['max'] = 0
+                                _probe_cache.pop(_server_key(s), None)
                         elif modify_btn.is_clicked(event.pos):
                             modify_server_dialog(s)
                         elif delete_btn.is_clicked(event.pos):
                             servers.remove(s)
-                            save_servers(servers)
-
-        pygame.display.flip()
-        clock.tick(FPS)
+                            save_later(save_servers, servers)
+        
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
+    
+    # Leaving mid-refresh: let the probes finish so their answers are still saved
+    if refresh_thread is not None:
+        refresh_thread.join()
+        apply_probe_results(probe_results)
+        save_later(save_servers, servers)
+    flush_saves()
 
 def add_server_dialog():
-    ip = text_input_box(t("enter_ip"))
-    if ip is None:
-        return
-    port = text_input_box(t("enter_port"))
-    if port is None:
-        return
-    password = text_input_box(t("enter_password"))
-    if password is None:
+    result = multi_input_box([(t("enter_ip"), ""), (t("enter_port"), ""), (t("enter_password"), "")])
+    if result is None:
         return
+    ip, port, password = result
     try:
         port = int(port)
     except:
         return
     s = {"ip": ip, "port": port, "password": password, "name": "???", "motd": "???", "current": 0, "max": 0}
     servers.append(s)
-    save_servers(servers)
+    save_later(save_servers, servers)
 
 def modify_server_dialog(s):
-    ip = text_input_box(f"{t('edit_ip')} ({s['ip']}):")
-    if ip is None:
-        return
-    port = text_input_box(f"{t('edit_port')} ({s['port']}):")
-    if port is None:
-        return
-    password = text_input_box(f"{t('edit_password')} ({s.get('password', '0')}):")
-    if password is None:
+    result = multi_input_box([
+        (f"{t('edit_ip')} ({s['ip']}):", ""),
+        (f"{t('edit_port')} ({s['port']}):", ""),
+        (f"{t('edit_password')} ({s.get('password', '0')}):", ""),
+    ])
+    if result is None:
         return
+    ip, port, password = result
     try:
         port = int(port)
     except:
@@ -1771,41 +2465,93 @@ def modify_server_dialog(s):
     s['ip'] = ip
     s['port'] = port
     s['password'] = password
-    save_servers(servers)
+    save_later(save_servers, servers)
 
-def refresh_servers():
-    for s in servers:
+def probe_server(ip, port, password=""):
+    """Log in just long enough to read the welcome packet, without a game session.
+    Returns the welcome message, {} if none arrived in time, or None if unreachable"""
+    try:
+        sock = socket.create_connection((ip, port), timeout=5)
+    except OSError as e:
+        print(f"Refresh error for {ip}:{port}: {e}")
+        return None
+    try:
+        send_msg(sock, {
+            "type": "login",
+            "id": PLAYER_ID,
+            "password": password,
+            "color": CURRENT_COLOR
+        })
+        deadline = time.monotonic() + 2.0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return {}
+            sock.settimeout(remaining)
+            msg = recv_msg(sock)
+            if not msg or msg.get("type") == "disconnect":
+                return {}
+            if msg.get("type") in ("welcome", "welcome_v2"):
+                return msg
+    except (OSError, ValueError) as e:
+        print(f"Refresh error for {ip}:{port}: {e}")
+        return {}
+    finally:
+        sock.close()
+
+PROBE_TTL = 30.0  # Seconds a server's answer is reused before probing it again
+_probe_cache = {}  # (ip, port, password) -> (time answered, {name, motd, current, max})
+
+def _server_key(s):
+    """(ip, port, password) of a saved server: what a probe asks and its cache key"""
+    return (s['ip'], s['port'], s.get('password', ''))
+
+def _probe_server(target):
+    """Probe one server; returns (s, key, {name, motd, current, max}) without touching s"""
+    s, key = target
+    cached = _probe_cache.get(key)
+    if cached and time.monotonic() - cached[0] < PROBE_TTL:
+        return s, key, cached[1]
+    welcome = probe_server(*key)
+    if welcome is None:
+        _probe_cache.pop(key, None)
+        return s, key, {"name": "Offline", "motd": "Server is offline", "current": 0, "max": 0}
+    fields = {
+        "name": welcome.get("server") or "???",
+        "motd": welcome.get("motd") or "???",
+        "current": welcome.get("current_players", 0),
+        "max": welcome.get("max_players", 10),
+    }
+    # Only real answers are worth reusing; a silent server gets asked again next time
+    if welcome:
+        _probe_cache[key] = (time.monotonic(), fields)
+    else:
+        _probe_cache.pop(key, None)
+    return s, key, fields
+
+def refresh_servers(targets, results):
+    """Probe (s, key) targets off the UI thread, putting each answer on results as it arrives.
+    The server dicts belong to the UI thread, which applies answers with apply_probe_results"""
+    if not targets:
+        return
+    # Probes are network-bound, so run them side by side: total time is the
+    # slowest server instead of the sum of all of them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(targets))) as pool:
+        for result in pool.map(_probe_server, targets):
+            results.put(result)
+
+def apply_probe_results(results):
+    """Copy queued probe answers into their server dicts; returns True if any was applied.
+    Answers for servers deleted or re-addressed since the probe started are dropped"""
+    applied = False
+    while True:
         try:
-            conn = ServerConnection(s['ip'], s['port'], s.get('password', ''))
-            if conn.connect():
-                # Wait for welcome packet with server info
-                max_wait = 2.0
-                elapsed = 0
-                while (not conn.server_name or not conn.motd) and elapsed < max_wait:
-                    time.sleep(0.1)
-                    elapsed += 0.1
-                
-                s['name'] = conn.server_name if conn.server_name else "???"
-                s['motd'] = conn.motd if conn.motd else "???"
-                s['current'] = conn.current_players
-                s['max'] = conn.max_players
-                try:
-                    conn.sock.close()
-                except:
-                    pass
-                conn.connected = False
-            else:
-                s['name'] = "Offline"
-                s['motd'] = "Server is offline"
-                s['current'] = 0
-                s['max'] = 0
-        except Exception as e:
-            print(f"Refresh error for {s['ip']}:{s['port']}: {e}")
-            s['name'] = "Offline"
-            s['motd'] = "Server is offline"
-            s['current'] = 0
-            s['max'] = 0
-    save_servers(servers)
+            s, key, fields = results.get_nowait()
+        except queue.Empty:
+            return applied
+        if any(entry is s for entry in servers) and _server_key(s) == key:
+            s.update(fields)
+            applied = True
 
 # =========================
 # IN-GAME MENU
@@ -1815,33 +2561,45 @@ def ingame_menu(conn):
     running = True
     result = "resume"
     
+    # The game frame behind the menu doesn't change while paused
+    game_frame = screen.copy()
+    
+    layout = None
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Create buttons dynamically
-        resume_btn = Button((SCREEN_WIDTH//2-100, 250, 200, 50), t("resume"))
-        settings_btn = Button((SCREEN_WIDTH//2-100, 320, 200, 50), t("settings"))
-        quit_btn = Button((SCREEN_WIDTH//2-100, 390, 200, 50), t("disconnect"))
-        
-        # Just draw overlay - game frame should still be visible
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)  # Semi-transparent
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 48, bold=True).render(t("paused"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 150))
-        
-        resume_btn.update(mouse_pos)
-        settings_btn.update(mouse_pos)
-        quit_btn.update(mouse_pos)
-        
-        resume_btn.draw(screen)
-        settings_btn.draw(screen)
-        quit_btn.draw(screen)
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            # Buttons are centered and translated: rebuild them only when resolution or language changes
+            if layout != (SCREEN_WIDTH, SCREEN_HEIGHT, CURRENT_LANG):
+                layout = (SCREEN_WIDTH, SCREEN_HEIGHT, CURRENT_LANG)
+                resume_btn = Button((SCREEN_WIDTH//2-100, 250, 200, 50), t("resume"))
+                settings_btn = Button((SCREEN_WIDTH//2-100, 320, 200, 50), t("settings"))
+                quit_btn = Button((SCREEN_WIDTH//2-100, 390, 200, 50), t("disconnect"))
+                buttons = [resume_btn, settings_btn, quit_btn]
+                
+                # Bake the darkened game frame once so redraws are a single opaque blit
+                backdrop = pygame.transform.scale(game_frame, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+                backdrop.blit(translucent((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0), 180), (0, 0))
+            
+            # Game frame stays visible under the overlay
+            screen.blit(backdrop, (0, 0))
+            
+            # Title
+            title = render_text(t("paused"), 48, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 150))
+            
+            draw_buttons(buttons, screen, mouse_pos)
+            
+            pygame.display.flip()
+            needs_redraw = False
         
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 result = "quit"
                 running = False
@@ -1861,46 +2619,50 @@ def ingame_menu(conn):
                     result = "quit"
                     running = False
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
     
     return result
 
 def ingame_settings(conn):
     """Settings menu accessible during gameplay"""
+    layout = None
     running = True
+    needs_redraw = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
+        if needs_redraw:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            # Buttons are centered and translated: rebuild them only when resolution or language changes
+            if layout != (SCREEN_WIDTH, SCREEN_HEIGHT, CURRENT_LANG):
+                layout = (SCREEN_WIDTH, SCREEN_HEIGHT, CURRENT_LANG)
+                controls_btn = Button((SCREEN_WIDTH//2-100, 150, 200, 50), t("controls"))
+                appearance_btn = Button((SCREEN_WIDTH//2-100, 210, 200, 50), t("appearance"))
+                video_btn = Button((SCREEN_WIDTH//2-100, 270, 200, 50), t("video"))
+                texture_btn = Button((SCREEN_WIDTH//2-100, 330, 200, 50), t("texture_packs"))
+                language_btn = Button((SCREEN_WIDTH//2-100, 390, 200, 50), t("language"))
+                back_btn = Button((50, 30, 100, 40), t("back"))
+                buttons = [controls_btn, appearance_btn, video_btn, texture_btn, language_btn, back_btn]
+            
+            screen.fill((30,30,30))
+            
+            # Title
+            title = render_text(t("settings"), 36, True, WHITE)
+            screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
+            
+            draw_buttons(buttons, screen, mouse_pos)
+            
+            pygame.display.flip()
+            needs_redraw = False
         
-        # Create buttons dynamically centered
-        controls_btn = Button((SCREEN_WIDTH//2-100, 150, 200, 50), t("controls"))
-        appearance_btn = Button((SCREEN_WIDTH//2-100, 210, 200, 50), t("appearance"))
-        video_btn = Button((SCREEN_WIDTH//2-100, 270, 200, 50), t("video"))
-        texture_btn = Button((SCREEN_WIDTH//2-100, 330, 200, 50), t("texture_packs"))
-        language_btn = Button((SCREEN_WIDTH//2-100, 390, 200, 50), t("language"))
-        back_btn = Button((50, 30, 100, 40), t("back"))
-        
-        screen.fill((30,30,30))
-        
-        # Title
-        title = pygame.font.SysFont("Arial", 36, bold=True).render(t("settings"), True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        
-        controls_btn.update(mouse_pos)
-        appearance_btn.update(mouse_pos)
-        video_btn.update(mouse_pos)
-        texture_btn.update(mouse_pos)
-        language_btn.update(mouse_pos)
-        back_btn.update(mouse_pos)
-        
-        controls_btn.draw(screen)
-        appearance_btn.draw(screen)
-        video_btn.draw(screen)
-        texture_btn.draw(screen)
-        language_btn.draw(screen)
-        back_btn.draw(screen)
-        
-        for event in pygame.event.get():
+        for event in wait_events():
+            # Hover changes alone are repainted below without a full redraw
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            else:
+                needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -1919,9 +2681,11 @@ def ingame_settings(conn):
                     texture_packs_screen()
                 elif language_btn.is_clicked(event.pos):
                     language_screen()
-        
-        pygame.display.flip()
-        clock.tick(FPS)
+
+        if not needs_redraw:
+            dirty = redraw_hover(buttons, screen, mouse_pos)
+            if dirty:
+                pygame.display.update(dirty)
 
 # =========================
 # INVENTORY HUD
@@ -1969,9 +2733,7 @@ def draw_inventory_hud(screen, conn, appearance_color, selected_slot, mouse_pos)
     hud_y = hotbar_y - hud_height + 50  # Position so it ends where hotbar begins
     
     # Semi-transparent background
-    bg_surface = pygame.Surface((hud_width, hud_height))
-    bg_surface.set_alpha(220)
-    bg_surface.fill((40, 40, 40))
+    bg_surface = translucent((hud_width, hud_height), (40, 40, 40), 220)
     screen.blit(bg_surface, (hud_x, hud_y))
     
     # Border
@@ -1981,7 +2743,7 @@ def draw_inventory_hud(screen, conn, appearance_color, selected_slot, mouse_pos)
     header_y = hud_y + 5
     
     # Player ID on RIGHT side (not overlapping crafting)
-    id_text = small_font.render(f"{PLAYER_ID}", True, (255, 255, 100))
+    id_text = render_text(f"{PLAYER_ID}", 14, False, (255, 255, 100))
     screen.blit(id_text, (hud_x + hud_width - 150, header_y))
     
     # Player preview (small) - next to ID
@@ -1996,7 +2758,7 @@ def draw_inventory_hud(screen, conn, appearance_color, selected_slot, mouse_pos)
     pygame.draw.rect(screen, BLACK, (preview_x, preview_y, 15, 10), 1)
     
     # Inventory title (CENTER)
-    inv_title = small_font.render(t("inventory"), True, WHITE)
+    inv_title = render_text(t("inventory"), 14, False, WHITE)
     screen.blit(inv_title, (hud_x + hud_width//2 - inv_title.get_width()//2, header_y))
     
     # Start of slots - MORE SPACE for header (40 instead of 30)
@@ -2004,7 +2766,7 @@ def draw_inventory_hud(screen, conn, appearance_color, selected_slot, mouse_pos)
     crafting_start_x = hud_x + 10
     
     # ===== CRAFTING GRID (LEFT SIDE) =====
-    crafting_title = small_font.render(t("crafting"), True, (255, 200, 100))
+    crafting_title = render_text(t("crafting"), 14, False, (255, 200, 100))
     screen.blit(crafting_title, (crafting_start_x, slots_start_y - 20))
     
     crafting_slots = []
@@ -2025,15 +2787,9 @@ def draw_inventory_hud(screen, conn, appearance_color, selected_slot, mouse_pos)
                 block_type = conn.crafting_grid[idx]["block"]
                 count = conn.crafting_grid[idx]["count"]
                 
-                texture = block_textures.get(block_type)
-                if texture:
-                    scaled_texture = pygame.transform.scale(texture, (slot_size - 6, slot_size - 6))
-                    screen.blit(scaled_texture, (slot_x + 3, slot_y + 3))
-                else:
-                    block_color = BLOCK_COLORS.get(block_type, GRAY)
-                    pygame.draw.rect(screen, block_color, (slot_x + 3, slot_y + 3, slot_size - 6, slot_size - 6))
+                screen.blit(block_icon(block_type, slot_size - 6), (slot_x + 3, slot_y + 3))
                 
-                count_text = small_font.render(str(count), True, WHITE)
+                count_text = render_text(str(count), 14, False, WHITE)
                 screen.blit(count_text, (slot_x + slot_size - 15, slot_y + slot_size - 15))
             
             crafting_slots.append(('crafting', idx, slot_rect))
@@ -2062,19 +2818,13 @@ def draw_inventory_hud(screen, conn, appearance_color, selected_slot, mouse_pos)
         block_type = craft_result["block"]
         count = craft_result["count"]
         
-        texture = block_textures.get(block_type)
-        if texture:
-            scaled_texture = pygame.transform.scale(texture, (slot_size - 6, slot_size - 6))
-            screen.blit(scaled_texture, (output_x + 3, output_y + 3))
-        else:
-            block_color = BLOCK_COLORS.get(block_type, GRAY)
-            pygame.draw.rect(screen, block_color, (output_x + 3, output_y + 3, slot_size - 6, slot_size - 6))
+        screen.blit(block_icon(block_type, slot_size - 6), (output_x + 3, output_y + 3))
         
-        count_text = small_font.render(str(count), True, WHITE)
+        count_text = render_text(str(count), 14, False, WHITE)
         screen.blit(count_text, (output_x + slot_size - 15, output_y + slot_size - 15))
         
         # Hint text
-        hint = small_font.render(t("click_to_craft"), True, (200, 200, 200))
+        hint = render_text(t("click_to_craft"), 14, False, (200, 200, 200))
         screen.blit(hint, (output_x - 10, output_y + slot_size + 5))
     
     crafting_slots.append(('craft_output', 0, output_rect))
@@ -2101,16 +2851,10 @@ def draw_inventory_hud(screen, conn, appearance_color, selected_slot, mouse_pos)
                 count = conn.inventory[idx]["count"]
                 
                 # Draw block texture or color
-                texture = block_textures.get(block_type)
-                if texture:
-                    scaled_texture = pygame.transform.scale(texture, (slot_size - 6, slot_size - 6))
-                    screen.blit(scaled_texture, (slot_x + 3, slot_y + 3))
-                else:
-                    block_color = BLOCK_COLORS.get(block_type, GRAY)
-                    pygame.draw.rect(screen, block_color, (slot_x + 3, slot_y + 3, slot_size - 6, slot_size - 6))
+                screen.blit(block_icon(block_type, slot_size - 6), (slot_x + 3, slot_y + 3))
                 
                 # Draw count
-                count_text = small_font.render(str(count), True, WHITE)
+                count_text = render_text(str(count), 14, False, WHITE)
                 screen.blit(count_text, (slot_x + slot_size - 15, slot_y + slot_size - 15))
             
             inventory_slots.append(('inventory', idx, slot_rect))
@@ -2137,16 +2881,10 @@ def draw_inventory_hud(screen, conn, appearance_color, selected_slot, mouse_pos)
             count = conn.hotbar[i]["count"]
             
             # Draw block texture or color
-            texture = block_textures.get(block_type)
-            if texture:
-                scaled_texture = pygame.transform.scale(texture, (slot_size - 6, slot_size - 6))
-                screen.blit(scaled_texture, (slot_x + 3, slot_y + 3))
-            else:
-                block_color = BLOCK_COLORS.get(block_type, GRAY)
-                pygame.draw.rect(screen, block_color, (slot_x + 3, slot_y + 3, slot_size - 6, slot_size - 6))
+            screen.blit(block_icon(block_type, slot_size - 6), (slot_x + 3, slot_y + 3))
             
             # Draw count
-            count_text = small_font.render(str(count), True, WHITE)
+            count_text = render_text(str(count), 14, False, WHITE)
             screen.blit(count_text, (slot_x + slot_size - 15, slot_y + slot_size - 15))
         
         hotbar_slots.append(('hotbar', i, slot_rect))
@@ -2186,16 +2924,14 @@ def draw_player_list(screen, conn, local_player_id, appearance_color):
     list_y = 20
     
     # Semi-transparent background
-    bg_surface = pygame.Surface((list_width, list_height))
-    bg_surface.set_alpha(220)
-    bg_surface.fill((40, 40, 40))
+    bg_surface = translucent((list_width, list_height), (40, 40, 40), 220)
     screen.blit(bg_surface, (list_x, list_y))
     
     # Border
     pygame.draw.rect(screen, (200, 200, 200), (list_x, list_y, list_width, list_height), 3)
     
     # Title
-    title_text = font.render(f"{t('players_online')} ({player_count})", True, WHITE)
+    title_text = render_text(f"{t('players_online')} ({player_count})", 18, False, WHITE)
     screen.blit(title_text, (list_x + list_width // 2 - title_text.get_width() // 2, list_y + 10))
     
     # Draw each player
@@ -2206,14 +2942,11 @@ def draw_player_list(screen, conn, local_player_id, appearance_color):
         player_y = y_offset
         
         # Background for player entry
-        entry_bg = pygame.Surface((player_width, player_height))
-        entry_bg.set_alpha(150)
-        
         # Highlight local player
         if pid == local_player_id:
-            entry_bg.fill((80, 120, 80))  # Green tint
+            entry_bg = translucent((player_width, player_height), (80, 120, 80), 150)  # Green tint
         else:
-            entry_bg.fill((60, 60, 60))
+            entry_bg = translucent((player_width, player_height), (60, 60, 60), 150)
         
         screen.blit(entry_bg, (player_x, player_y))
         pygame.draw.rect(screen, (150, 150, 150), (player_x, player_y, player_width, player_height), 1)
@@ -2240,21 +2973,21 @@ def draw_player_list(screen, conn, local_player_id, appearance_color):
         pygame.draw.rect(screen, BLACK, head_rect, 1)
         
         # Player ID (right side)
-        id_text = font.render(pid, True, WHITE)
+        id_text = render_text(pid, 18, False, WHITE)
         text_x = player_x + 50
         text_y = player_y + player_height // 2 - id_text.get_height() // 2
         screen.blit(id_text, (text_x, text_y))
         
         # "YOU" indicator for local player
         if pid == local_player_id:
-            you_text = small_font.render(f"({t('you')})", True, (100, 255, 100))
+            you_text = render_text(f"({t('you')})", 14, False, (100, 255, 100))
             screen.blit(you_text, (player_x + player_width - 50, text_y + 3))
         
         y_offset += player_height + spacing_between
     
     # Instructions at bottom - properly spaced below last player
     key_name = get_key_name(controls.get("player_list", pygame.K_TAB))
-    instr_text = small_font.render(f"{t('hold_to_view')} {key_name}", True, (180, 180, 180))
+    instr_text = render_text(f"{t('hold_to_view')} {key_name}", 14, False, (180, 180, 180))
     # Position footer text with proper spacing from last player
     footer_y = list_y + title_height + (player_height + spacing_between) * player_count + 8
     screen.blit(instr_text, (list_x + list_width // 2 - instr_text.get_width() // 2, footer_y))
@@ -2265,17 +2998,13 @@ def draw_player_list(screen, conn, local_player_id, appearance_color):
 def game_screen(conn: ServerConnection):
     # Wait for welcome packet with world data
     print("Waiting for server welcome packet...")
-    wait_time = 0
-    max_wait = 5
-    while wait_time < max_wait:
-        if conn.world and len(conn.world) > 0:
-            print(f"World received! Size: {len(conn.world)}x{len(conn.world[0])}")
-            break
-        if not conn.connected:
-            print("Connection lost while waiting for world data")
-            return
-        time.sleep(0.1)
-        wait_time += 0.1
+    # Wakes on the welcome or on disconnect, whichever comes first
+    conn.ready_event.wait(timeout=5)
+    if conn.world and len(conn.world) > 0:
+        print(f"World received! Size: {len(conn.world)}x{len(conn.world[0])}")
+    elif not conn.connected:
+        print("Connection lost while waiting for world data")
+        return
     
     if not conn.world or len(conn.world) == 0:
         print("Failed to receive world data from server")
@@ -2303,7 +3032,7 @@ def game_screen(conn: ServerConnection):
         blocks_clear = True
         for check_y in [player_grid_y, player_grid_y + 1]:
             if 0 <= check_y < len(conn.world) and 0 <= player_grid_x < len(conn.world[0]):
-                if conn.world[check_y][player_grid_x] != "air":
+                if conn.world[check_y][player_grid_x] != AIR:
                     blocks_clear = False
                     break
         
@@ -2324,6 +3053,11 @@ def game_screen(conn: ServerConnection):
     camera_x = 0
     camera_y = 0
     
+    # Rendered world chunks, valid for one world and one texture pack
+    chunk_cache = {}
+    chunk_world = None
+    chunk_textures = None
+    
     # Hotbar
     selected_slot = 0
     
@@ -2337,6 +3071,13 @@ def game_screen(conn: ServerConnection):
     chat_open = False
     chat_input = ""
     
+    # HUD panel and the values it was last rendered with
+    hud_key = None
+    hud_panel = None
+    
+    # Key bindings, re-read whenever the in-game menu may have changed them
+    (key_chat, key_inventory, mb_break, mb_place, key_sprint, key_climb_up, key_climb_down, key_left, key_right, key_jump, key_player_list) = game_bindings()
+    
     running = True
     frame_count = 0
     
@@ -2357,12 +3098,19 @@ def game_screen(conn: ServerConnection):
             conn.respawn_flag = False
             print(f"Respawned to ({player_x}, {player_y})")
         
-        keys = pygame.key.get_pressed()
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_buttons = pygame.mouse.get_pressed()
-        
-        # Events
-        for event in pygame.event.get():
+        # The world and its size are fixed for the frame
+        world = conn.world
+        world_h = len(world)
+        world_w = len(world[0])
+        # One snapshot of the other players per frame; the dispatcher thread keeps
+        # adding and removing entries, which would break iterating the dict itself
+        others = list(conn.players.items())
+        
+        # Events (clock.tick above already paced the frame, so this is the one pump per frame).
+        # Pull just what the game handles, filtered in C, and drop the rest unread
+        events = pygame.event.get(GAME_EVENTS)
+        pygame.event.clear(pump=False)
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -2373,6 +3121,7 @@ def game_screen(conn: ServerConnection):
                     else:
                         # Open in-game menu
                         choice = ingame_menu(conn)
+                        (key_chat, key_inventory, mb_break, mb_place, key_sprint, key_climb_up, key_climb_down, key_left, key_right, key_jump, key_player_list) = game_bindings()
                         if choice == "quit":
                             running = False
                         elif choice == "settings":
@@ -2392,10 +3141,10 @@ def game_screen(conn: ServerConnection):
                             chat_input += event.unicode
                 else:
                     # When chat is NOT open
-                    if event.key == controls.get("chat", pygame.K_t):
+                    if event.key == key_chat:
                         chat_open = True
                         chat_input = ""
-                    elif event.key == controls.get("inventory", pygame.K_e):
+                    elif event.key == key_inventory:
                         # Toggle inventory
                         inventory_open = not inventory_open
                         if not inventory_open:
@@ -2420,7 +3169,7 @@ def game_screen(conn: ServerConnection):
                     if event.button == 1:  # Left click
                         # Check if clicking craft_output
                         for slot_type, slot_idx, slot_rect in inv_slots:
-                            if slot_rect.collidepoint(mouse_pos) and slot_type == 'craft_output':
+                            if slot_rect.collidepoint(event.pos) and slot_type == 'craft_output':
                                 craft_result = calculate_craft(conn.crafting_grid)
                                 if craft_result:
                                     # Consume 1 log from crafting grid
@@ -2461,8 +3210,8 @@ def game_screen(conn: ServerConnection):
                                 break
                 elif not chat_open:
                     # Get block position under mouse
-                    world_mouse_x = (mouse_pos[0] + camera_x) // BLOCK_SIZE
-                    world_mouse_y = (mouse_pos[1] + camera_y) // BLOCK_SIZE
+                    world_mouse_x = (event.pos[0] + camera_x) // BLOCK_SIZE
+                    world_mouse_y = (event.pos[1] + camera_y) // BLOCK_SIZE
                     
                     # Check if within 2 blocks distance from player
                     player_block_x = int(player_x)
@@ -2477,29 +3226,29 @@ def game_screen(conn: ServerConnection):
                     # Can reach if within 2 blocks horizontally and 3 blocks vertically (since player is 2 blocks tall)
                     can_reach = (dx <= 2 and dy <= 3)
                     
-                    if event.button == controls.get("break_block", 1):
+                    if event.button == mb_break:
                         # Break block
-                        if can_reach and 0 <= world_mouse_y < len(conn.world) and 0 <= world_mouse_x < len(conn.world[0]):
+                        if can_reach and 0 <= world_mouse_y < world_h and 0 <= world_mouse_x < world_w:
                             conn.break_block(world_mouse_x, world_mouse_y)
-                    elif event.button == controls.get("place_block", 3):
+                    elif event.button == mb_place:
                         # Place block
-                        if can_reach and 0 <= world_mouse_y < len(conn.world) and 0 <= world_mouse_x < len(conn.world[0]):
+                        if can_reach and 0 <= world_mouse_y < world_h and 0 <= world_mouse_x < world_w:
                             # Check if slot is not empty
                             if conn.hotbar[selected_slot] is not None:
                                 # Check if not placing inside player
                                 if not ((world_mouse_x == player_block_x and (world_mouse_y == player_block_y or world_mouse_y == player_block_y + 1))):
                                     conn.place_block(world_mouse_x, world_mouse_y, selected_slot)
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if inventory_open and event.button == 1 and hasattr(event, '_inv_slots'):
-                    # Handle inventory drop
-                    pass  # Will be implemented with rendering
+        
+        # Sample input state after the queue is drained so it reflects this frame
+        keys = pygame.key.get_pressed()
+        mouse_pos = pygame.mouse.get_pos()
         
         # Player movement (only if not in chat)
         if not chat_open:
             move_speed = 5
             
             # Sprint modifier
-            if keys[controls.get("sprint", pygame.K_LSHIFT)]:
+            if keys[key_sprint]:
                 move_speed = 9  # Sprint is 1.8x faster
             
             # Check if on ladder
@@ -2508,26 +3257,26 @@ def game_screen(conn: ServerConnection):
             on_ladder = False
             
             for check_y in [player_grid_y, player_grid_y + 1]:
-                if 0 <= check_y < len(conn.world) and 0 <= player_grid_x < len(conn.world[0]):
-                    if conn.world[check_y][player_grid_x] == "ladder":
+                if 0 <= check_y < world_h and 0 <= player_grid_x < world_w:
+                    if world[check_y][player_grid_x] == LADDER:
                         on_ladder = True
                         break
             
             # Ladder climbing
             if on_ladder:
                 climb_speed = 3
-                if keys[controls.get("climb_up", pygame.K_w)]:
+                if keys[key_climb_up]:
                     player_y -= climb_speed * delta_time
                     player_vy = 0  # Cancel gravity
-                elif keys[controls.get("climb_down", pygame.K_s)]:
+                elif keys[key_climb_down]:
                     player_y += climb_speed * delta_time
                     player_vy = 0  # Cancel gravity
                 else:
                     player_vy = 0  # Stay on ladder, no falling
             
-            if keys[controls.get("move_left", pygame.K_a)]:
+            if keys[key_left]:
                 player_vx = -move_speed
-            elif keys[controls.get("move_right", pygame.K_d)]:
+            elif keys[key_right]:
                 player_vx = move_speed
             else:
                 player_vx = 0
@@ -2539,107 +3288,15 @@ def game_screen(conn: ServerConnection):
                     player_vy = 15
             
             # Jump (not when on ladder)
-            if keys[controls.get("jump", pygame.K_SPACE)] and on_ground and not on_ladder:
+            if keys[key_jump] and on_ground and not on_ladder:
                 player_vy = -12
             
-            # Apply horizontal velocity first
-            if player_vx != 0:
-                new_x = player_x + player_vx * delta_time
-                
-                # Check horizontal collisions BEFORE moving
-                player_grid_x_new = int(new_x)
-                can_move_x = True
-                
-                for check_y in [player_grid_y, player_grid_y + 1]:
-                    for offset in [-1, 0, 1]:
-                        check_x = player_grid_x_new + offset
-                        if 0 <= check_y < len(conn.world) and 0 <= check_x < len(conn.world[0]):
-                            block_type = conn.world[check_y][check_x]
-                            # Ladder is climbable, not solid
-                            if block_type != "air" and block_type != "ladder":
-                                block_left = check_x
-                                block_right = check_x + 1
-                                block_top = check_y
-                                block_bottom = check_y + 1
-                                
-                                new_player_left = new_x - 0.4
-                                new_player_right = new_x + 0.4
-                                player_top = player_y
-                                player_bottom = player_y + 2
-                                
-                                # Check if we would collide
-                                if (player_bottom > block_top + 0.1 and 
-                                    player_top < block_bottom - 0.1 and
-                                    new_player_right > block_left and 
-                                    new_player_left < block_right):
-                                    can_move_x = False
-                                    break
-                    if not can_move_x:
-                        break
-                
-                if can_move_x:
-                    player_x = new_x
-            
-            # Apply vertical velocity
-            player_y += player_vy * delta_time
-            
-            # Clamp to world bounds to prevent going outside
-            player_x = max(0.5, min(player_x, len(conn.world[0]) - 1.5))
-            player_y = max(0, min(player_y, len(conn.world) - 2.5))
-            
-            # Collision detection
-            player_grid_x = int(player_x)
-            player_grid_y = int(player_y)
-            
-            # Check collisions with blocks - vertical only now
-            on_ground = False
-            
-            # Vertical collision - improved to prevent wall jump bugs
-            for check_y in [player_grid_y, player_grid_y + 1, player_grid_y + 2]:
-                for check_x in [player_grid_x - 1, player_grid_x, player_grid_x + 1]:
-                    if 0 <= check_y < len(conn.world) and 0 <= check_x < len(conn.world[0]):
-                        block_type = conn.world[check_y][check_x]
-                        # Ladder is climbable, not solid
-                        if block_type != "air" and block_type != "ladder":
-                            block_left = check_x
-                            block_right = check_x + 1
-                            block_top = check_y
-                            block_bottom = check_y + 1
-                            
-                            player_left = player_x - 0.4
-                            player_right = player_x + 0.4
-                            player_top = player_y
-                            player_bottom = player_y + 2
-                            
-                            # More precise horizontal overlap check
-                            h_overlap = min(player_right, block_right) - max(player_left, block_left)
-                            
-                            # Only consider vertical collision if there's significant horizontal overlap
-                            if h_overlap > 0.1:
-                                if player_bottom > block_top and player_top < block_bottom:
-                                    # Collision detected
-                                    if player_vy > 0:  # Falling
-                                        # Only snap to ground if bottom is close to block top
-                                        if player_bottom - block_top < 0.5:
-                                            player_y = block_top - 2
-                                            player_vy = 0
-                                            on_ground = True
-                                    elif player_vy < 0:  # Jumping into ceiling
-                                        # Only snap to ceiling if top is close to block bottom
-                                        if block_bottom - player_top < 0.5:
-                                            player_y = block_bottom
-                                            player_vy = 0
-            
-            # Keep player in bounds
-            if player_x < 0.5:
-                player_x = 0.5
-            if player_x > len(conn.world[0]) - 1.5:
-                player_x = len(conn.world[0]) - 1.5
-            if player_y < 0:
-                player_y = 0
+            # Move and collide with the world
+            player_x, player_y, player_vy, on_ground = resolve_collisions(
+                world, player_x, player_y, player_vx, player_vy, delta_time)
             
             # Player-to-player collisions
-            for other_pid, (other_x, other_y) in conn.players.items():
+            for other_x, other_y in conn.players_near(player_x, player_y):
                 # Check if players overlap
                 dx = abs(player_x - other_x)
                 dy = abs(player_y - other_y)
@@ -2655,75 +3312,55 @@ def game_screen(conn: ServerConnection):
             # Send position to server
             conn.send_position(player_x, player_y)
         
-        # Update camera
-        camera_x = int(player_x * BLOCK_SIZE - SCREEN_WIDTH // 2)
-        camera_y = int(player_y * BLOCK_SIZE - SCREEN_HEIGHT // 2)
-        
-        # Keep camera in bounds
-        if camera_x < 0:
-            camera_x = 0
-        if camera_y < 0:
-            camera_y = 0
-        world_width = len(conn.world[0]) * BLOCK_SIZE
-        world_height = len(conn.world) * BLOCK_SIZE
-        if camera_x > world_width - SCREEN_WIDTH:
-            camera_x = max(0, world_width - SCREEN_WIDTH)
-        if camera_y > world_height - SCREEN_HEIGHT:
-            camera_y = max(0, world_height - SCREEN_HEIGHT)
+        # Update camera, kept inside the world (pinned to 0 if the world is smaller than the screen)
+        camera_x = max(0, min(int(player_x * BLOCK_SIZE - SCREEN_WIDTH // 2), world_w * BLOCK_SIZE - SCREEN_WIDTH))
+        camera_y = max(0, min(int(player_y * BLOCK_SIZE - SCREEN_HEIGHT // 2), world_h * BLOCK_SIZE - SCREEN_HEIGHT))
         
         # RENDER
         screen.fill(SKY_BLUE)
         
-        # Draw world
-        for y, row in enumerate(conn.world):
-            for x, block in enumerate(row):
-                screen_x = x * BLOCK_SIZE - camera_x
-                screen_y = y * BLOCK_SIZE - camera_y
-                
-                if -BLOCK_SIZE < screen_x < SCREEN_WIDTH and -BLOCK_SIZE < screen_y < SCREEN_HEIGHT:
-                    if block != "air":
-                        draw_block(screen, block, screen_x, screen_y)
-        
-        # Draw other players
-        for other_pid, (ox, oy) in conn.players.items():
+        # Draw world: blit cached chunks, re-rasterizing only those the server changed
+        if chunk_world is not world or chunk_textures is not block_textures:
+            chunk_world = world
+            chunk_textures = block_textures
+            chunk_cache.clear()
+            conn.dirty_chunks.clear()
+        while conn.dirty_chunks:
+            chunk_cache.pop(conn.dirty_chunks.pop(), None)
+        
+        chunk_px = CHUNK_SIZE * BLOCK_SIZE
+        last_cx = min((camera_x + SCREEN_WIDTH) // chunk_px, (world_w - 1) // CHUNK_SIZE)
+        last_cy = min((camera_y + SCREEN_HEIGHT) // chunk_px, (world_h - 1) // CHUNK_SIZE)
+        for cy in range(camera_y // chunk_px, last_cy + 1):
+            for cx in range(camera_x // chunk_px, last_cx + 1):
+                chunk = chunk_cache.get((cx, cy))
+                if chunk is None:
+                    chunk = chunk_cache[(cx, cy)] = render_chunk(world, cx, cy)
+                screen.blit(chunk, (cx * chunk_px - camera_x, cy * chunk_px - camera_y))
+        
+        # Draw other players, then the local one on top, in a single blits() call
+        player_blits = []
+        for other_pid, (ox, oy) in others:
             screen_x = int(ox * BLOCK_SIZE - camera_x)
             screen_y = int(oy * BLOCK_SIZE - camera_y)
             
             # Get player's color
             other_color_name = conn.player_colors.get(other_pid, "cyan")
             other_body_color = PLAYER_COLORS.get(other_color_name, (0, 255, 255))
-            
-            # Body (bottom block)
-            body_rect = pygame.Rect(screen_x - PLAYER_WIDTH // 2, screen_y + PLAYER_HEIGHT // 2, PLAYER_WIDTH, PLAYER_HEIGHT // 2)
-            pygame.draw.rect(screen, other_body_color, body_rect)
-            pygame.draw.rect(screen, BLACK, body_rect, 2)
-            
-            # Head (top block)
-            head_rect = pygame.Rect(screen_x - PLAYER_WIDTH // 2, screen_y, PLAYER_WIDTH, PLAYER_HEIGHT // 2)
-            pygame.draw.rect(screen, PINK, head_rect)
-            pygame.draw.rect(screen, BLACK, head_rect, 2)
+            player_blits.append((player_sprite(other_body_color), (screen_x - PLAYER_WIDTH // 2, screen_y)))
             
             # Draw name
-            name_label = small_font.render(other_pid, True, WHITE)
-            name_rect = name_label.get_rect(center=(screen_x, screen_y - 10))
-            screen.blit(name_label, name_rect)
+            name_label = render_text(other_pid, 14, False, WHITE)
+            player_blits.append((name_label, name_label.get_rect(center=(screen_x, screen_y - 10))))
         
         # Draw player
         screen_x = int(player_x * BLOCK_SIZE - camera_x)
         screen_y = int(player_y * BLOCK_SIZE - camera_y)
         
         # Get player's chosen color
-        player_body_color = PLAYER_COLORS.get(appearance.get("player_color", "blue"), (0, 0, 255))
-        
-        # Body (bottom block)
-        body_rect = pygame.Rect(screen_x - PLAYER_WIDTH // 2, screen_y + PLAYER_HEIGHT // 2, PLAYER_WIDTH, PLAYER_HEIGHT // 2)
-        pygame.draw.rect(screen, player_body_color, body_rect)
-        pygame.draw.rect(screen, BLACK, body_rect, 2)
-        
-        # Head (top block)
-        head_rect = pygame.Rect(screen_x - PLAYER_WIDTH // 2, screen_y, PLAYER_WIDTH, PLAYER_HEIGHT // 2)
-        pygame.draw.rect(screen, PINK, head_rect)
-        pygame.draw.rect(screen, BLACK, head_rect, 2)
+        player_body_color = PLAYER_COLORS.get(CURRENT_COLOR, (0, 0, 255))
+        player_blits.append((player_sprite(player_body_color), (screen_x - PLAYER_WIDTH // 2, screen_y)))
+        screen.blits(player_blits, doreturn=False)
         
         # Draw inventory HUD or hotbar
         if inventory_open:
@@ -2732,7 +3369,7 @@ def game_screen(conn: ServerConnection):
                 conn.inventory = [None] * 21
             
             # Draw full inventory HUD
-            inv_slots = draw_inventory_hud(screen, conn, appearance.get("player_color", "blue"), selected_slot, mouse_pos)
+            inv_slots = draw_inventory_hud(screen, conn, CURRENT_COLOR, selected_slot, mouse_pos)
             
             # Handle drag & drop
             if pygame.mouse.get_pressed()[0]:  # Left mouse held
@@ -2934,67 +3571,32 @@ def game_screen(conn: ServerConnection):
                 count = dragging_item["count"]
                 slot_size = 40
                 
-                texture = block_textures.get(block_type)
-                if texture:
-                    scaled_texture = pygame.transform.scale(texture, (slot_size - 6, slot_size - 6))
-                    screen.blit(scaled_texture, (mouse_pos[0] - (slot_size - 6)//2, mouse_pos[1] - (slot_size - 6)//2))
-                else:
-                    block_color = BLOCK_COLORS.get(block_type, GRAY)
-                    pygame.draw.rect(screen, block_color, (mouse_pos[0] - (slot_size - 6)//2, mouse_pos[1] - (slot_size - 6)//2, slot_size - 6, slot_size - 6))
+                screen.blit(block_icon(block_type, slot_size - 6), (mouse_pos[0] - (slot_size - 6)//2, mouse_pos[1] - (slot_size - 6)//2))
                 
-                count_text = small_font.render(str(count), True, WHITE)
+                count_text = render_text(str(count), 14, False, WHITE)
                 screen.blit(count_text, (mouse_pos[0] + 10, mouse_pos[1] + 10))
         else:
-            # Draw simple hotbar
-            hotbar_width = 7 * 50 + 20
-            hotbar_x = SCREEN_WIDTH // 2 - hotbar_width // 2
+            # Draw simple hotbar: one cached strip, then just the filled slots
+            hotbar_x = SCREEN_WIDTH // 2 - HOTBAR_WIDTH // 2
             hotbar_y = SCREEN_HEIGHT - 70
+            slot_blits = [(hotbar_strip(selected_slot), (hotbar_x - 10, hotbar_y - 10))]
             
-            # Hotbar background
-            hotbar_bg = pygame.Surface((hotbar_width, 60))
-            hotbar_bg.set_alpha(200)
-            hotbar_bg.fill((50, 50, 50))
-            screen.blit(hotbar_bg, (hotbar_x - 10, hotbar_y - 10))
-            
-            for i in range(7):
-                slot_x = hotbar_x + i * 50
-                slot_y = hotbar_y
-                
-                # Draw slot background
-                if i == selected_slot:
-                    pygame.draw.rect(screen, (255, 255, 100), (slot_x - 2, slot_y - 2, 44, 44), 3)
-                else:
-                    pygame.draw.rect(screen, WHITE, (slot_x, slot_y, 40, 40), 2)
-                
-                # Draw item
-                if conn.hotbar[i] is not None:
-                    block_type = conn.hotbar[i]["block"]
-                    count = conn.hotbar[i]["count"]
-                    
-                    # Draw block preview with texture
-                    texture = block_textures.get(block_type)
-                    if texture:
-                        # Scale texture to fit slot
-                        scaled_texture = pygame.transform.scale(texture, (30, 30))
-                        screen.blit(scaled_texture, (slot_x + 5, slot_y + 5))
-                    else:
-                        # Fallback to color
-                        block_color = BLOCK_COLORS.get(block_type, GRAY)
-                        pygame.draw.rect(screen, block_color, (slot_x + 5, slot_y + 5, 30, 30))
-                    
-                    # Draw count
-                    count_text = small_font.render(str(count), True, WHITE)
-                    screen.blit(count_text, (slot_x + 25, slot_y + 25))
+            for i, item in enumerate(conn.hotbar[:HOTBAR_SLOTS]):
+                if item is not None:
+                    slot_x = hotbar_x + i * HOTBAR_PITCH
+                    slot_blits.append((block_icon(item["block"], 30), (slot_x + 5, hotbar_y + 5)))
+                    slot_blits.append((render_text(str(item["count"]), 14, False, WHITE), (slot_x + 25, hotbar_y + 25)))
+            screen.blits(slot_blits, doreturn=False)
         
         # Draw chat preview (last 5 messages)
         chat_y = 10
-        for msg in conn.chat_messages[-5:]:
-            chat_surface = small_font.render(msg, True, WHITE)
+        # Snapshot first: the listener thread may append while we iterate
+        chat_lines = list(conn.chat_messages)
+        for msg in chat_lines[-5:]:
+            chat_surface = render_text(msg, 14, False, WHITE)
             # Semi-transparent background
             bg_rect = pygame.Rect(10, chat_y, chat_surface.get_width() + 10, 20)
-            s = pygame.Surface((bg_rect.width, bg_rect.height))
-            s.set_alpha(180)
-            s.fill((0, 0, 0))
+            s = translucent((bg_rect.width, bg_rect.height), (0, 0, 0), 180)
             screen.blit(s, bg_rect)
             screen.blit(chat_surface, (15, chat_y + 2))
             chat_y += 22
@@ -3002,15 +3604,13 @@ def game_screen(conn: ServerConnection):
         # Draw chat input if open
         if chat_open:
             # Full chat overlay
-            chat_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            chat_bg.set_alpha(200)
-            chat_bg.fill((0, 0, 0))
+            chat_bg = translucent((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0), 200)
             screen.blit(chat_bg, (0, 0))
             
             # Chat messages
             y = 50
-            for msg in conn.chat_messages[-20:]:
-                msg_surface = font.render(msg, True, WHITE)
+            for msg in chat_lines[-20:]:
+                msg_surface = render_text(msg, 18, False, WHITE)
                 screen.blit(msg_surface, (20, y))
                 y += 25
             
@@ -3019,39 +3619,39 @@ def game_screen(conn: ServerConnection):
             pygame.draw.rect(screen, WHITE, (20, input_y, SCREEN_WIDTH - 40, 40))
             pygame.draw.rect(screen, BLACK, (20, input_y, SCREEN_WIDTH - 40, 40), 2)
             
-            input_surface = font.render(chat_input, True, BLACK)
+            input_surface = render_text(chat_input, 18, False, BLACK)
             screen.blit(input_surface, (30, input_y + 10))
             
             # Cursor
-            if int(time.time() * 2) % 2:
+            if pygame.time.get_ticks() // 500 % 2:
                 cursor_x = 30 + input_surface.get_width()
                 pygame.draw.line(screen, BLACK, (cursor_x, input_y + 8), (cursor_x, input_y + 32), 2)
             
             # Instructions
-            info = small_font.render(t("press_enter_send"), True, (200, 200, 200))
+            info = render_text(t("press_enter_send"), 14, False, (200, 200, 200))
             screen.blit(info, (SCREEN_WIDTH // 2 - info.get_width() // 2, input_y - 30))
         
         # Draw TAB player list if configured key is held
-        if keys[controls.get("player_list", pygame.K_TAB)] and not chat_open:
-            draw_player_list(screen, conn, PLAYER_ID, appearance.get("player_color", "blue"))
-        
-        # Draw HUD
-        info_bg = pygame.Surface((280, 90))
-        info_bg.set_alpha(180)
-        info_bg.fill((0, 0, 0))
-        screen.blit(info_bg, (10, SCREEN_HEIGHT - 170))
-        
-        hud_text = [
-            f"{t('server')}: {conn.server_name}",
-            f"{t('position')}: ({int(player_x)}, {int(player_y)})",
-            f"{t('players')}: {len(conn.players) + 1}",
-            f"{t('level')}: {conn.player_level}",
-        ]
-        hud_y = SCREEN_HEIGHT - 165
-        for line in hud_text:
-            text_surface = small_font.render(line, True, WHITE)
-            screen.blit(text_surface, (15, hud_y))
-            hud_y += 20
+        if keys[key_player_list] and not chat_open:
+            draw_player_list(screen, conn, PLAYER_ID, CURRENT_COLOR)
+        
+        # Draw HUD, re-rendering the panel only when one of its values changes
+        hud_values = (CURRENT_LANG, conn.server_name, int(player_x), int(player_y), len(conn.players), conn.player_level)
+        if hud_values != hud_key:
+            hud_key = hud_values
+            hud_text = [
+                f"{t('server')}: {conn.server_name}",
+                f"{t('position')}: ({int(player_x)}, {int(player_y)})",
+                f"{t('players')}: {len(conn.players) + 1}",
+                f"{t('level')}: {conn.player_level}",
+            ]
+            hud_panel = pygame.Surface((280, 90), pygame.SRCALPHA).convert_alpha()
+            hud_panel.fill((0, 0, 0, 180))
+            for i, line in enumerate(hud_text):
+                # Position changes constantly, so render it directly rather than filling the text cache
+                label = small_font.render(line, True, WHITE) if i == 1 else render_text(line, 14, False, WHITE)
+                hud_panel.blit(label, (5, 5 + i * 20))
+        screen.blit(hud_panel, (10, SCREEN_HEIGHT - 170))
         
         pygame.display.flip()
     
@@ -3070,4 +3670,5 @@ def game_screen(conn: ServerConnection):
 if __name__ == "__main__":
     if main_menu():
         pass
+    flush_saves()
     pygame.quit()